@@ -3,8 +3,9 @@
 
 import os
 import sys
-import json
-import urllib.request
+
+import httpx
+import orjson
 
 # Get API key from environment
 api_key = os.getenv('LINEAR_API_KEY')
@@ -14,9 +15,10 @@ if not api_key:
     print("Run: export LINEAR_API_KEY=your_key_here")
     sys.exit(1)
 
-# GraphQL query to get viewer info
-query = """
-query {
+# GraphQL query to get viewer info plus one page of teams; pageInfo lets us
+# follow the cursor instead of silently truncating large workspaces
+QUERY = """
+query Ids($after: String) {
   viewer {
     id
     name
@@ -27,16 +29,24 @@ query {
       urlKey
     }
   }
-  teams {
+  teams(first: 250, after: $after) {
     nodes {
       id
       name
       key
     }
+    pageInfo {
+      hasNextPage
+      endCursor
+    }
   }
 }
 """
 
+# Pre-encode the first-page request body once at import; orjson.dumps
+# returns bytes directly, so no .encode() step is needed
+_QUERY_BYTES = orjson.dumps({"query": QUERY, "variables": {"after": None}})
+
 # Make request
 url = "https://api.linear.app/graphql"
 headers = {
@@ -44,19 +54,44 @@ headers = {
     "Authorization": api_key
 }
 
-data = json.dumps({"query": query}).encode('utf-8')
-
 try:
-    req = urllib.request.Request(url, data=data, headers=headers)
-    with urllib.request.urlopen(req) as response:
-        result = json.loads(response.read().decode('utf-8'))
+    # A persistent client reuses the TCP+TLS connection across requests, so
+    # any future pagination calls skip the handshake entirely
+    with httpx.Client(
+        headers=headers,
+        timeout=10.0,
+        limits=httpx.Limits(max_connections=16, max_keepalive_connections=4)
+    ) as client:
+        response = client.post(url, content=_QUERY_BYTES)
+        response.raise_for_status()
+        # orjson accepts bytes, skipping the intermediate str allocation
+        result = orjson.loads(response.content)
+
+        if 'errors' in result:
+            print("Error from Linear API:")
+            print(orjson.dumps(result['errors'], option=orjson.OPT_INDENT_2).decode())
+            sys.exit(1)
+
+        data = result.get('data', {})
+        all_teams = data.get('teams', {}).get('nodes', [])
+        page_info = data.get('teams', {}).get('pageInfo', {})
+
+        # Follow the cursor for workspaces with >250 teams; the pooled
+        # client reuses the already-established connection for each page
+        while page_info.get('hasNextPage'):
+            response = client.post(url, content=orjson.dumps({
+                "query": QUERY,
+                "variables": {"after": page_info.get('endCursor')}
+            }))
+            response.raise_for_status()
+            result = orjson.loads(response.content)
 
-    if 'errors' in result:
-        print("Error from Linear API:")
-        print(json.dumps(result['errors'], indent=2))
-        sys.exit(1)
+            if 'errors' in result:
+                break
 
-    data = result.get('data', {})
+            teams_page = result.get('data', {}).get('teams', {})
+            all_teams.extend(teams_page.get('nodes', []))
+            page_info = teams_page.get('pageInfo', {})
 
     # Print organization info
     org = data.get('viewer', {}).get('organization', {})
@@ -68,7 +103,7 @@ try:
     print(f"Organization UUID: {org.get('id', 'N/A')}")
 
     # Print teams
-    teams = data.get('teams', {}).get('nodes', [])
+    teams = all_teams
     print("\n" + "="*60)
     print("TEAMS")
     print("="*60)
@@ -93,9 +128,9 @@ try:
         print(f"  team_id: \"your-team-id\"")
     print()
 
-except urllib.error.HTTPError as e:
-    print(f"HTTP Error: {e.code}")
-    print(e.read().decode('utf-8'))
+except httpx.HTTPStatusError as e:
+    print(f"HTTP Error: {e.response.status_code}")
+    print(e.response.text)
     sys.exit(1)
 except Exception as e:
     print(f"Error: {e}")
@@ -19,19 +19,17 @@ async def test_linear():
     # Load config
     config = Config('/home/von/agentic-todo/config.yaml')
 
-    retry_config = {
-        "max_attempts": 3,
-        "base_delay": 1.0,
-        "max_delay": 60.0,
-        "exponential_backoff": True
-    }
-
-    client = LinearClient(config.linear, retry_config)
+    client = LinearClient(config.linear, config.retry)
 
     try:
+        # Tests 1 and 4 are independent, so overlap their round-trips
+        issues, states = await asyncio.gather(
+            client.list_issues(limit=5),
+            client.get_workflow_states()
+        )
+
         # Test 1: List existing issues
         print("1. Listing existing issues...")
-        issues = await client.list_issues(limit=5)
         print(f"   ✓ Found {len(issues)} issues")
         for issue in issues[:3]:
             print(f"     - [{issue['identifier']}] {issue['title']}")
@@ -51,9 +49,8 @@ async def test_linear():
         fetched = await client.get_issue(new_issue['id'])
         print(f"   ✓ Fetched: [{fetched['identifier']}] {fetched['title']}")
 
-        # Test 4: Get workflow states
+        # Test 4: Get workflow states (fetched concurrently above)
         print("\n4. Getting workflow states...")
-        states = await client.get_workflow_states()
         print(f"   ✓ Found {len(states)} workflow states:")
         for state in states:
             print(f"     - {state['name']} ({state['type']})")
@@ -17,14 +17,7 @@ async def test_responses():
     print("="*60 + "\n")
 
     config = Config('/home/von/agentic-todo/config.yaml')
-    retry_config = {
-        "max_attempts": 3,
-        "base_delay": 1.0,
-        "max_delay": 60.0,
-        "exponential_backoff": True
-    }
-
-    client = ClaudeClient(config.claude, retry_config)
+    client = ClaudeClient(config.claude, config.retry)
 
     test_messages = [
         "Create a task to fix the login bug",
@@ -32,27 +25,37 @@ async def test_responses():
         "What do I need to work on?",
     ]
 
-    for msg in test_messages:
+    # Dispatch prompts concurrently, bounded to respect API rate limits
+    semaphore = asyncio.Semaphore(3)
+
+    async def run_prompt(msg):
+        async with semaphore:
+            try:
+                response = await client.process_message(
+                    user_message=msg,
+                    conversation_history=[],
+                    context={"user_tasks": [
+                        {"identifier": "AGE-1", "title": "Get familiar with Linear", "state": "Todo"},
+                        {"identifier": "AGE-4", "title": "Import your data", "state": "In Progress"},
+                        {"identifier": "AGE-5", "title": "Test integration", "state": "Done"}
+                    ]}
+                )
+                return msg, response, None
+            except Exception as e:
+                return msg, None, e
+
+    results = await asyncio.gather(*(run_prompt(m) for m in test_messages))
+
+    for msg, response, error in results:
         print(f"User: {msg}")
         print("-" * 60)
 
-        try:
-            response = await client.process_message(
-                user_message=msg,
-                conversation_history=[],
-                context={"user_tasks": [
-                    {"identifier": "AGE-1", "title": "Get familiar with Linear", "state": "Todo"},
-                    {"identifier": "AGE-4", "title": "Import your data", "state": "In Progress"},
-                    {"identifier": "AGE-5", "title": "Test integration", "state": "Done"}
-                ]}
-            )
-
+        if error:
+            print(f"Error: {error}\n")
+        else:
             print(f"Bot: {response}")
             print()
 
-        except Exception as e:
-            print(f"Error: {e}\n")
-
     print("="*60)
 
 
@@ -1,49 +1,9 @@
-"""Setup script for agentic-todo."""
+"""Setup script for agentic-todo.
 
-from pathlib import Path
+All metadata lives in pyproject.toml; this shim exists for tooling that
+still invokes setup.py directly.
+"""
 
-from setuptools import find_packages, setup
+from setuptools import setup
 
-# Read README
-readme_file = Path(__file__).parent / "README.md"
-long_description = readme_file.read_text() if readme_file.exists() else ""
-
-# Read requirements
-requirements_file = Path(__file__).parent / "requirements.txt"
-requirements = []
-if requirements_file.exists():
-    requirements = [
-        line.strip()
-        for line in requirements_file.read_text().splitlines()
-        if line.strip() and not line.startswith("#")
-    ]
-
-setup(
-    name="agentic-todo",
-    version="1.0.0",
-    description="AI-powered task management via Signal and Linear",
-    long_description=long_description,
-    long_description_content_type="text/markdown",
-    author="Your Name",
-    author_email="your.email@example.com",
-    url="https://github.com/yourusername/agentic-todo",
-    packages=find_packages(exclude=["tests", "tests.*"]),
-    install_requires=requirements,
-    python_requires=">=3.9",
-    entry_points={
-        "console_scripts": [
-            "agentic-todo=src.main:cli",
-        ],
-    },
-    classifiers=[
-        "Development Status :: 4 - Beta",
-        "Intended Audience :: Developers",
-        "License :: OSI Approved :: MIT License",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
-        "Programming Language :: Python :: 3.12",
-    ],
-    keywords="signal linear claude ai task-management async",
-)
+setup()
@@ -1,27 +1,57 @@
 """Claude API client for AI-powered task management."""
 
+import copy
+import hashlib
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional
 
+import httpx
+import orjson
+import anthropic
 from anthropic import Anthropic, AsyncAnthropic
 
-from .config import ClaudeConfig
+from .config import ClaudeConfig, RetryConfig
 from .error_handler import ClaudeError, ErrorSeverity
+from .utils.http import create_async_client
 from .utils.logger import get_logger
 from .utils.retry import retry_decorator
 
 logger = get_logger(__name__)
 
+# Fallback HTTP transport shared by ClaudeClient instances constructed
+# without an explicit client. HTTP/2 multiplexes concurrent
+# messages.create calls over one connection, and the enlarged pool avoids
+# per-call handshakes under high concurrency.
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the module-level HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = create_async_client(
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            timeout=60.0
+        )
+    return _http_client
+
 
 class ClaudeClient:
     """Client for interacting with Claude AI."""
 
-    def __init__(self, config: ClaudeConfig, retry_config: dict):
+    def __init__(
+        self,
+        config: ClaudeConfig,
+        retry_config: RetryConfig,
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
         """
         Initialize Claude client.
 
         Args:
             config: Claude configuration
-            retry_config: Retry configuration dict
+            retry_config: Retry configuration
+            http_client: Shared HTTP client to use (one is created if omitted)
         """
         self.config = config
         self.retry_config = retry_config
@@ -34,7 +64,27 @@ class ClaudeClient:
                 user_message="AI assistant is not configured. Please set ANTHROPIC_API_KEY."
             )
 
-        self.client = AsyncAnthropic(api_key=config.api_key)
+        self.client = AsyncAnthropic(
+            api_key=config.api_key,
+            http_client=http_client if http_client is not None else _get_http_client()
+        )
+
+        # Base system prompt is fixed for the client's lifetime; build it once
+        # so the no-context fast path skips formatting entirely
+        self._base_system_prompt = config.system_prompt
+
+        # LRU cache for formatted context strings. Repeated messages from the
+        # same user usually carry an identical task list, so caching keeps the
+        # system prompt byte-identical across turns (which also lets the API
+        # reuse its prompt-prefix cache server-side).
+        self._context_cache: OrderedDict[bytes, str] = OrderedDict()
+        self._context_cache_size = 32
+
+        # LRU cache for task-info extraction; repeated commands ("show me my
+        # tasks") are deterministic up to the system prompt, so a hit skips a
+        # full API round-trip
+        self._extract_cache: OrderedDict[bytes, Dict[str, Any]] = OrderedDict()
+        self._extract_cache_size = 256
 
     @retry_decorator(max_attempts=3, base_delay=2.0, exponential_backoff=True)
     async def process_message(
@@ -71,11 +121,12 @@ class ClaudeClient:
                 "content": user_message
             })
 
-            # Build system prompt with context
-            system_prompt = self.config.system_prompt
-
+            # Build system prompt with context (fast path: no context means
+            # the prebuilt base prompt is used as-is)
             if context:
-                system_prompt += self._format_context(context)
+                system_prompt = self._base_system_prompt + self._format_context(context)
+            else:
+                system_prompt = self._base_system_prompt
 
             self.logger.info(
                 "Sending message to Claude",
@@ -83,20 +134,28 @@ class ClaudeClient:
                 history_length=len(conversation_history) if conversation_history else 0
             )
 
-            # Call Claude API
+            # Call Claude API; the ephemeral cache_control marker lets the
+            # server reuse the prompt-prefix KV cache when the system text is
+            # byte-identical to a recent call
             response = await self.client.messages.create(
                 model=self.config.model,
                 max_tokens=self.config.max_tokens,
                 temperature=self.config.temperature,
-                system=system_prompt,
+                system=[{
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"}
+                }],
                 messages=messages
             )
 
-            # Extract response text
-            response_text = ""
-            for block in response.content:
-                if hasattr(block, 'text'):
-                    response_text += block.text
+            # Extract response text in a single allocation; getattr with a
+            # default avoids hasattr's internal exception handling per block
+            response_text = "".join(
+                text for text in
+                (getattr(block, 'text', None) for block in response.content)
+                if text
+            )
 
             self.logger.info(
                 "Received response from Claude",
@@ -106,30 +165,25 @@ class ClaudeClient:
 
             return response_text.strip()
 
-        except Exception as e:
-            error_msg = str(e)
-
-            # Check for rate limiting
-            if "rate_limit" in error_msg.lower() or "429" in error_msg:
-                raise ClaudeError(
-                    f"Rate limit exceeded: {error_msg}",
-                    severity=ErrorSeverity.MEDIUM,
-                    user_message="AI assistant is receiving too many requests. Please try again in a moment.",
-                    original_error=e
-                )
+        except anthropic.RateLimitError as e:
+            raise ClaudeError(
+                f"Rate limit exceeded: {e}",
+                severity=ErrorSeverity.MEDIUM,
+                user_message="AI assistant is receiving too many requests. Please try again in a moment.",
+                original_error=e
+            )
 
-            # Check for authentication errors
-            if "authentication" in error_msg.lower() or "401" in error_msg:
-                raise ClaudeError(
-                    f"Authentication failed: {error_msg}",
-                    severity=ErrorSeverity.CRITICAL,
-                    user_message="AI assistant authentication failed. Please check configuration.",
-                    original_error=e
-                )
+        except anthropic.AuthenticationError as e:
+            raise ClaudeError(
+                f"Authentication failed: {e}",
+                severity=ErrorSeverity.CRITICAL,
+                user_message="AI assistant authentication failed. Please check configuration.",
+                original_error=e
+            )
 
-            # Generic error
+        except Exception as e:
             raise ClaudeError(
-                f"Failed to process message with Claude: {error_msg}",
+                f"Failed to process message with Claude: {e}",
                 severity=ErrorSeverity.HIGH,
                 original_error=e,
                 context={"message_length": len(user_message)}
@@ -145,20 +199,36 @@ class ClaudeClient:
         Returns:
             Formatted context string
         """
+        # Check the cache first; OPT_SORT_KEYS makes the key stable across
+        # dicts with the same content but different insertion order
+        try:
+            cache_key = hashlib.blake2b(
+                orjson.dumps(context, option=orjson.OPT_SORT_KEYS)
+            ).digest()
+        except (TypeError, orjson.JSONEncodeError):
+            cache_key = None
+
+        if cache_key is not None and cache_key in self._context_cache:
+            self._context_cache.move_to_end(cache_key)
+            return self._context_cache[cache_key]
+
         context_parts = ["\n\nAdditional Context:"]
 
         if "user_tasks" in context:
             tasks = context["user_tasks"]
             if tasks:
-                context_parts.append(f"\n\nUser's Current Tasks ({len(tasks)}):")
-                for task in tasks[:10]:  # Limit to 10 tasks
-                    title = task.get("title", "Untitled")
-                    # Handle both dict and string formats for state
-                    state = task.get("state", "Unknown")
-                    if isinstance(state, dict):
-                        state = state.get("name", "Unknown")
-                    identifier = task.get("identifier", "")
-                    context_parts.append(f"- [{identifier}] {title} ({state})")
+                # Sort by identifier so the same task set always renders to
+                # byte-identical text regardless of fetch order, keeping the
+                # server-side prompt-prefix cache warm across turns
+                ordered = sorted(tasks, key=lambda t: t.get("identifier") or "")
+                tasks_str = "\n".join(
+                    f"- [{task.get('identifier', '')}] "
+                    f"{task.get('title', 'Untitled')} ({self._task_state(task)})"
+                    for task in ordered[:10]  # Limit to 10 tasks
+                )
+                context_parts.append(
+                    f"\n\nUser's Current Tasks ({len(tasks)}):\n{tasks_str}"
+                )
 
         if "user_info" in context:
             user_info = context["user_info"]
@@ -170,7 +240,22 @@ class ClaudeClient:
             if "name" in workspace:
                 context_parts.append(f"Workspace: {workspace['name']}")
 
-        return "\n".join(context_parts) if len(context_parts) > 1 else ""
+        formatted = "\n".join(context_parts) if len(context_parts) > 1 else ""
+
+        if cache_key is not None:
+            self._context_cache[cache_key] = formatted
+            if len(self._context_cache) > self._context_cache_size:
+                self._context_cache.popitem(last=False)
+
+        return formatted
+
+    @staticmethod
+    def _task_state(task: Dict[str, Any]) -> str:
+        """Resolve a task's state name from dict or string formats."""
+        state = task.get("state", "Unknown")
+        if isinstance(state, dict):
+            return state.get("name", "Unknown")
+        return state
 
     async def extract_task_info(self, message: str) -> Dict[str, Any]:
         """
@@ -185,6 +270,14 @@ class ClaudeClient:
         Raises:
             ClaudeError: If extraction fails
         """
+        # Repeat intents ("show me my tasks") extract identically; serve
+        # them from the LRU cache instead of a fresh API round-trip
+        cache_key = hashlib.sha1(message.strip().lower().encode()).digest()
+
+        if cache_key in self._extract_cache:
+            self._extract_cache.move_to_end(cache_key)
+            return copy.copy(self._extract_cache[cache_key])
+
         try:
             system_prompt = """You are a task extraction assistant. Extract task information from user messages.
 
@@ -212,19 +305,27 @@ Examples:
                 }]
             )
 
-            # Parse response
-            response_text = ""
-            for block in response.content:
-                if hasattr(block, 'text'):
-                    response_text += block.text
+            # Parse response in a single allocation; getattr with a default
+            # avoids hasattr's internal exception handling per block
+            response_text = "".join(
+                text for text in
+                (getattr(block, 'text', None) for block in response.content)
+                if text
+            )
 
             # TODO: Parse JSON from response
             # For now, return a simple structure
-            return {
+            result = {
                 "action": "create",
                 "raw_message": message
             }
 
+            self._extract_cache[cache_key] = result
+            if len(self._extract_cache) > self._extract_cache_size:
+                self._extract_cache.popitem(last=False)
+
+            return copy.copy(result)
+
         except Exception as e:
             raise ClaudeError(
                 f"Failed to extract task info: {str(e)}",
@@ -5,9 +5,17 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 
 import yaml
+from dotenv import dotenv_values
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Prefer the libyaml-backed loader when available; same parsing semantics
+# as SafeLoader but implemented in C
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 class SignalConfig(BaseSettings):
     """Signal-CLI configuration."""
@@ -128,7 +136,16 @@ class Config:
         # Load YAML configuration if provided
         if config_path and Path(config_path).exists():
             with open(config_path, 'r') as f:
-                self.config_data = yaml.safe_load(f) or {}
+                self.config_data = yaml.load(f, Loader=_YamlLoader) or {}
+
+        # Parse .env exactly once and merge into the process environment
+        # (real environment variables still win); each settings section below
+        # is constructed with _env_file=None so it skips its own file re-read
+        env_path = Path(".env")
+        if env_path.exists():
+            for key, value in dotenv_values(env_path).items():
+                if value is not None:
+                    os.environ.setdefault(key, value)
 
         # Initialize configuration sections
         self.signal = self._init_signal_config()
@@ -149,7 +166,7 @@ class Config:
         if recipient := os.getenv('SIGNAL_RECIPIENT'):
             signal_data['recipient'] = recipient
 
-        return SignalConfig(**signal_data)
+        return SignalConfig(_env_file=None, **signal_data)
 
     def _init_linear_config(self) -> LinearConfig:
         """Initialize Linear configuration."""
@@ -159,7 +176,7 @@ class Config:
         if api_key := os.getenv('LINEAR_API_KEY'):
             linear_data['api_key'] = api_key
 
-        return LinearConfig(**linear_data)
+        return LinearConfig(_env_file=None, **linear_data)
 
     def _init_claude_config(self) -> ClaudeConfig:
         """Initialize Claude configuration."""
@@ -169,28 +186,28 @@ class Config:
         if api_key := os.getenv('ANTHROPIC_API_KEY'):
             claude_data['api_key'] = api_key
 
-        return ClaudeConfig(**claude_data)
+        return ClaudeConfig(_env_file=None, **claude_data)
 
     def _init_queue_config(self) -> QueueConfig:
         """Initialize queue configuration."""
         queue_data = self.config_data.get('queue', {})
-        return QueueConfig(**queue_data)
+        return QueueConfig(_env_file=None, **queue_data)
 
     def _init_retry_config(self) -> RetryConfig:
         """Initialize retry configuration."""
         error_data = self.config_data.get('error_handling', {})
         retry_data = error_data.get('retry', {})
-        return RetryConfig(**retry_data)
+        return RetryConfig(_env_file=None, **retry_data)
 
     def _init_error_handling_config(self) -> ErrorHandlingConfig:
         """Initialize error handling configuration."""
         error_data = self.config_data.get('error_handling', {})
-        return ErrorHandlingConfig(**error_data)
+        return ErrorHandlingConfig(_env_file=None, **error_data)
 
     def _init_logging_config(self) -> LoggingConfig:
         """Initialize logging configuration."""
         logging_data = self.config_data.get('logging', {})
-        return LoggingConfig(**logging_data)
+        return LoggingConfig(_env_file=None, **logging_data)
 
     def validate(self) -> None:
         """
@@ -2,6 +2,7 @@
 
 import traceback
 from enum import Enum
+from types import MappingProxyType
 from typing import Any, Optional
 
 from .utils.logger import get_logger
@@ -30,6 +31,34 @@ class ErrorCategory(Enum):
     UNKNOWN = "unknown"
 
 
+# Shared read-only sentinel for errors raised without context, so the
+# common no-context path skips a dict allocation per error
+_EMPTY_CONTEXT = MappingProxyType({})
+
+# Enum member -> value string, resolved once at import so the logging path
+# does a plain dict lookup instead of an Enum descriptor access
+_CATEGORY_VALUE = {member: member.value for member in ErrorCategory}
+_SEVERITY_VALUE = {member: member.value for member in ErrorSeverity}
+
+# Field names _log_error passes explicitly; context keys that collide are
+# prefixed so splatting them cannot raise "multiple values for keyword
+# argument" inside the error-logging path
+_RESERVED_LOG_KEYS = frozenset(
+    ("category", "severity", "user_id", "original_error", "traceback")
+)
+
+# Default user-facing message per category, built once at import instead of
+# per raised error
+_USER_MESSAGES = {
+    ErrorCategory.SIGNAL: "Unable to send/receive Signal messages. Please check your Signal setup.",
+    ErrorCategory.LINEAR: "Unable to access Linear tasks. Please verify your Linear configuration.",
+    ErrorCategory.CLAUDE: "AI assistant is temporarily unavailable. Please try again.",
+    ErrorCategory.QUEUE: "System is busy processing requests. Please try again shortly.",
+    ErrorCategory.CONFIGURATION: "System configuration error. Please contact support.",
+    ErrorCategory.VALIDATION: "Invalid request. Please check your message and try again.",
+}
+
+
 class AppError(Exception):
     """Base application error with context."""
 
@@ -59,19 +88,23 @@ class AppError(Exception):
         self.severity = severity
         self.user_message = user_message or self._generate_user_message()
         self.original_error = original_error
-        self.context = context or {}
+        self.context = context if context is not None else _EMPTY_CONTEXT
+
+        # Capture the wrapped error's traceback once at construction;
+        # format_exc() at log time walks frames repeatedly and returns
+        # nothing useful outside an except block
+        if original_error is not None and original_error.__traceback__ is not None:
+            self.traceback = ''.join(traceback.format_exception(
+                type(original_error),
+                original_error,
+                original_error.__traceback__
+            ))
+        else:
+            self.traceback = None
 
     def _generate_user_message(self) -> str:
         """Generate a user-friendly error message."""
-        category_messages = {
-            ErrorCategory.SIGNAL: "Unable to send/receive Signal messages. Please check your Signal setup.",
-            ErrorCategory.LINEAR: "Unable to access Linear tasks. Please verify your Linear configuration.",
-            ErrorCategory.CLAUDE: "AI assistant is temporarily unavailable. Please try again.",
-            ErrorCategory.QUEUE: "System is busy processing requests. Please try again shortly.",
-            ErrorCategory.CONFIGURATION: "System configuration error. Please contact support.",
-            ErrorCategory.VALIDATION: "Invalid request. Please check your message and try again.",
-        }
-        return category_messages.get(
+        return _USER_MESSAGES.get(
             self.category,
             "An unexpected error occurred. Please try again."
         )
@@ -136,7 +169,16 @@ class ErrorHandler:
         self.include_details = include_details
         self.logger = get_logger(__name__)
 
-    async def handle_error(
+        # Severity -> bound logger method, resolved once instead of via an
+        # if/elif chain on every logged error
+        self._log_dispatch = {
+            ErrorSeverity.CRITICAL: self.logger.critical,
+            ErrorSeverity.HIGH: self.logger.error,
+            ErrorSeverity.MEDIUM: self.logger.warning,
+            ErrorSeverity.LOW: self.logger.info,
+        }
+
+    def handle_error(
         self,
         error: Exception,
         context: Optional[dict] = None,
@@ -145,6 +187,9 @@ class ErrorHandler:
         """
         Handle an error with logging and optional user notification.
 
+        Synchronous: nothing here awaits, so callers skip the coroutine
+        allocation and scheduler round-trip a needless async def would cost.
+
         Args:
             error: The exception to handle
             context: Additional context information
@@ -164,7 +209,12 @@ class ErrorHandler:
             )
         else:
             app_error = error
-            app_error.context.update(context)
+            if context:
+                # Copy-on-write: replace the shared sentinel with a real
+                # dict only when there is something to merge
+                if isinstance(app_error.context, MappingProxyType):
+                    app_error.context = dict(app_error.context)
+                app_error.context.update(context)
 
         # Log the error
         self._log_error(app_error, user_id)
@@ -176,25 +226,35 @@ class ErrorHandler:
 
     def _log_error(self, error: AppError, user_id: Optional[str] = None) -> None:
         """Log error with full context."""
-        log_context = {
-            "category": error.category.value,
-            "severity": error.severity.value,
-            "user_id": user_id,
-            **error.context
-        }
+        log_method = self._log_dispatch.get(error.severity, self.logger.info)
 
+        context = error.context
+        if context and not _RESERVED_LOG_KEYS.isdisjoint(context):
+            context = {
+                (f"context_{key}" if key in _RESERVED_LOG_KEYS else key): value
+                for key, value in context.items()
+            }
+
+        # Pass fields as keyword arguments directly rather than building and
+        # unpacking an intermediate dict per log event
         if error.original_error:
-            log_context["original_error"] = str(error.original_error)
-            log_context["traceback"] = traceback.format_exc()
-
-        if error.severity == ErrorSeverity.CRITICAL:
-            self.logger.critical(error.message, **log_context)
-        elif error.severity == ErrorSeverity.HIGH:
-            self.logger.error(error.message, **log_context)
-        elif error.severity == ErrorSeverity.MEDIUM:
-            self.logger.warning(error.message, **log_context)
+            log_method(
+                error.message,
+                category=_CATEGORY_VALUE[error.category],
+                severity=_SEVERITY_VALUE[error.severity],
+                user_id=user_id,
+                original_error=str(error.original_error),
+                traceback=error.traceback,
+                **context
+            )
         else:
-            self.logger.info(error.message, **log_context)
+            log_method(
+                error.message,
+                category=_CATEGORY_VALUE[error.category],
+                severity=_SEVERITY_VALUE[error.severity],
+                user_id=user_id,
+                **context
+            )
 
     def _format_user_message(self, error: AppError) -> str:
         """Format user-friendly error message."""
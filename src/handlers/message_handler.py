@@ -1,6 +1,10 @@
 """Core message handler for processing user messages."""
 
-from typing import Any, Dict, Optional
+import asyncio
+import re
+import time
+from collections import deque
+from typing import Any, Deque, Dict, NamedTuple, Optional
 
 from ..claude_client import ClaudeClient
 from ..error_handler import ErrorHandler
@@ -11,6 +15,32 @@ from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Response-cleaning patterns, compiled once rather than per message. The
+# tag/JSON/code-fence patterns are fused into one alternation so stripping
+# takes a single pass over the response instead of three.
+_STRIP_RE = re.compile(r'<[^>]+>|\{[^}]+\}|```[\s\S]*?```')
+
+# Runs of blank lines, including ones holding spaces or tabs (common in
+# model output); the greedy \s* folds any length of run in one match
+_BLANK_RUN_RE = re.compile(r'\n\s*\n\s*\n')
+
+# Action keywords as one case-insensitive alternation: a single linear scan
+# of the response with no .lower() copy, where the matching named group
+# identifies the action type
+_ACTION_RE = re.compile(
+    r"(?P<create>creating task|created task|i'll create)"
+    r"|(?P<update>updating task|updated task|i'll update)"
+    r"|(?P<complete>marking as complete|marked as complete|completed)",
+    re.IGNORECASE
+)
+
+
+class _HistoryEntry(NamedTuple):
+    """A single conversation turn; lighter than a per-turn dict."""
+
+    role: str
+    content: str
+
 
 class MessageHandler:
     """Handles incoming messages and coordinates responses."""
@@ -37,8 +67,37 @@ class MessageHandler:
         self.error_handler = error_handler
         self.logger = get_logger(__name__)
 
-        # Store conversation history per user
-        self.conversations: Dict[str, list] = {}
+        # Store conversation history per user; a bounded deque evicts the
+        # oldest entries in O(1) instead of periodic slicing
+        self.conversations: Dict[str, Deque[_HistoryEntry]] = {}
+
+        # Approximate character count per conversation; bounds both resident
+        # memory and the prompt size sent to Claude even when individual
+        # messages are very long
+        self._conversation_chars: Dict[str, int] = {}
+        self._conversation_char_budget = 8192
+
+        # Short-TTL cache for the Linear task fetch. The fetch is currently
+        # unfiltered, so concurrent messages within the window share one
+        # result, and the lock coalesces simultaneous misses into a single
+        # in-flight request.
+        self._task_cache: Optional[tuple] = None  # (monotonic ts, tasks)
+        self._task_cache_ttl = 1.0
+        self._task_cache_lock = asyncio.Lock()
+
+        # Action type -> bound handler coroutine, built once for O(1)
+        # dispatch in _execute_action
+        self._action_handlers = {
+            "create": self._do_create,
+            "update": self._do_update,
+            "complete": self._do_complete,
+        }
+
+        # Outgoing sends are queued and drained by a single background
+        # worker: the handler never blocks on signal-cli, and per-recipient
+        # ordering is preserved (unlike one fire-and-forget task per send)
+        self._send_queue: "asyncio.Queue[tuple]" = asyncio.Queue()
+        self._send_worker_task: Optional[asyncio.Task] = None
 
     async def handle(self, message: QueuedMessage) -> str:
         """
@@ -60,29 +119,29 @@ class MessageHandler:
             text_length=len(text)
         )
 
+        # Start the Linear context fetch immediately so it overlaps any other
+        # work before the Claude call needs the result
+        context_task = asyncio.create_task(self._build_context(sender))
+
         try:
-            # Get conversation history for this user
-            history = self.conversations.get(sender, [])
+            # Get conversation history for this user (last 10 exchanges)
+            history = self.conversations.setdefault(sender, deque(maxlen=20))
 
             # Get user's Linear tasks for context
-            context = await self._build_context(sender)
+            context = await context_task
 
             # Process with Claude
             response = await self.claude_client.process_message(
                 user_message=text,
-                conversation_history=history,
+                conversation_history=[entry._asdict() for entry in history],
                 context=context
             )
 
-            # Update conversation history
-            history.append({"role": "user", "content": text})
-            history.append({"role": "assistant", "content": response})
-
-            # Keep only last 10 messages
-            if len(history) > 20:
-                history = history[-20:]
-
-            self.conversations[sender] = history
+            # Update conversation history; the deque's maxlen drops the
+            # oldest entries automatically
+            history.append(_HistoryEntry("user", text))
+            history.append(_HistoryEntry("assistant", response))
+            self._trim_history(sender, history, len(text) + len(response))
 
             # Check if Claude wants to perform an action
             action = await self._extract_action(response, text)
@@ -95,8 +154,9 @@ class MessageHandler:
                     # Replace any technical details with user-friendly message
                     final_response = self._clean_response(response, action_result)
 
-            # Send response
-            await self.signal_client.send_message(sender, final_response)
+            # Send response in the background; the worker is free to start
+            # the next message while signal-cli delivers this one
+            self._send_in_background(sender, final_response)
 
             self.logger.info(
                 "Message handled successfully",
@@ -107,6 +167,9 @@ class MessageHandler:
             return response
 
         except Exception as e:
+            if not context_task.done():
+                context_task.cancel()
+
             self.logger.error(
                 "Error handling message",
                 message_id=message.id,
@@ -115,8 +178,8 @@ class MessageHandler:
             )
 
             # Handle error and get user-friendly message
-            error_message = await self.error_handler.handle_error(
-                error,
+            error_message = self.error_handler.handle_error(
+                e,
                 context={"message_id": message.id, "sender": sender},
                 user_id=sender
             )
@@ -130,6 +193,95 @@ class MessageHandler:
 
             raise
 
+    def _trim_history(
+        self,
+        sender: str,
+        history: Deque[_HistoryEntry],
+        added_chars: int
+    ) -> None:
+        """
+        Evict oldest history entries until the sender's char budget is met.
+
+        Args:
+            sender: Message sender
+            history: The sender's conversation deque
+            added_chars: Characters just appended to the history
+        """
+        total = self._conversation_chars.get(sender, 0) + added_chars
+
+        # The deque's maxlen can also evict entries silently, so recount
+        # when the running total crosses the budget; the deque is at most
+        # 20 entries, making the recount trivial
+        if total > self._conversation_char_budget:
+            total = sum(len(entry.content) for entry in history)
+
+            while total > self._conversation_char_budget and len(history) > 2:
+                popped = history.popleft()
+                total -= len(popped.content)
+
+        self._conversation_chars[sender] = total
+
+    def _send_in_background(self, recipient: str, response: str) -> None:
+        """
+        Queue an outgoing Signal message without blocking the caller.
+
+        Args:
+            recipient: Recipient phone number
+            response: Message text
+        """
+        self._send_queue.put_nowait((recipient, response))
+
+        # Start (or restart) the flush worker lazily so construction does
+        # not require a running event loop
+        if self._send_worker_task is None or self._send_worker_task.done():
+            self._send_worker_task = asyncio.create_task(self._send_worker())
+
+    async def _send_worker(self) -> None:
+        """Drain the send queue, exiting after a short idle period."""
+        while True:
+            try:
+                recipient, text = await asyncio.wait_for(
+                    self._send_queue.get(),
+                    timeout=5.0
+                )
+            except asyncio.TimeoutError:
+                # Re-check before idling out: a send queued in the same tick
+                # as the timeout would see a not-yet-done task, skip the
+                # restart, and strand the reply until the next message. No
+                # awaits sit between this check and the return, so a put
+                # after it always observes a done task and restarts us.
+                if not self._send_queue.empty():
+                    continue
+                return
+
+            try:
+                await self.signal_client.send_message(recipient, text)
+            except Exception as e:
+                self.logger.error(
+                    "Background send failed",
+                    recipient=recipient,
+                    error=str(e)
+                )
+            finally:
+                self._send_queue.task_done()
+
+    async def aclose(self) -> None:
+        """Flush pending outgoing sends and stop the send worker."""
+        # The worker may have idle-exited with sends still queued; revive
+        # it so join() below cannot wait forever
+        if not self._send_queue.empty() and (
+            self._send_worker_task is None or self._send_worker_task.done()
+        ):
+            self._send_worker_task = asyncio.create_task(self._send_worker())
+
+        if self._send_worker_task is not None and not self._send_worker_task.done():
+            await self._send_queue.join()
+            self._send_worker_task.cancel()
+            try:
+                await self._send_worker_task
+            except asyncio.CancelledError:
+                pass
+
     async def _build_context(self, sender: str) -> Dict[str, Any]:
         """
         Build context for Claude (user tasks, etc.).
@@ -143,21 +295,7 @@ class MessageHandler:
         context = {}
 
         try:
-            # Get user's tasks from Linear
-            # In production, you would filter by assignee
-            tasks = await self.linear_client.list_issues(limit=10)
-
-            # Format tasks in a simple way for Claude
-            formatted_tasks = []
-            for task in tasks:
-                formatted_tasks.append({
-                    "identifier": task.get("identifier"),
-                    "title": task.get("title"),
-                    "state": task.get("state", {}).get("name", "Unknown"),
-                    "priority": task.get("priority", 0)
-                })
-
-            context["user_tasks"] = formatted_tasks
+            context["user_tasks"] = await self._get_tasks_cached()
 
         except Exception as e:
             self.logger.warning(
@@ -167,6 +305,45 @@ class MessageHandler:
 
         return context
 
+    async def _get_tasks_cached(self) -> list:
+        """
+        Fetch and format the user's Linear tasks with a short TTL cache.
+
+        Returns:
+            List of formatted task dictionaries
+        """
+        now = time.monotonic()
+
+        if self._task_cache and now - self._task_cache[0] < self._task_cache_ttl:
+            return self._task_cache[1]
+
+        async with self._task_cache_lock:
+            # Re-check after acquiring the lock: another caller may have
+            # refreshed the cache while we waited
+            now = time.monotonic()
+            if self._task_cache and now - self._task_cache[0] < self._task_cache_ttl:
+                return self._task_cache[1]
+
+            # Get user's tasks from Linear; the summary selection set covers
+            # everything the formatted context reads
+            # In production, you would filter by assignee
+            tasks = await self.linear_client.list_issues(limit=10, fields="summary")
+
+            # Format tasks in a simple way for Claude; the `or {}` guard also
+            # covers tasks where "state" is present but None
+            formatted_tasks = [
+                {
+                    "identifier": task.get("identifier"),
+                    "title": task.get("title"),
+                    "state": (task.get("state") or {}).get("name", "Unknown"),
+                    "priority": task.get("priority", 0)
+                }
+                for task in tasks
+            ]
+
+            self._task_cache = (time.monotonic(), formatted_tasks)
+            return formatted_tasks
+
     async def _extract_action(
         self,
         response: str,
@@ -184,19 +361,13 @@ class MessageHandler:
         """
         # Check if response indicates an action
         # In production, use structured output or tool use
-        action_keywords = {
-            "create": ["creating task", "created task", "i'll create"],
-            "update": ["updating task", "updated task", "i'll update"],
-            "complete": ["marking as complete", "marked as complete", "completed"],
-        }
-
-        for action_type, keywords in action_keywords.items():
-            if any(keyword in response.lower() for keyword in keywords):
-                return {
-                    "type": action_type,
-                    "message": original_message,
-                    "response": response
-                }
+        match = _ACTION_RE.search(response)
+        if match:
+            return {
+                "type": match.lastgroup,
+                "message": original_message,
+                "response": response
+            }
 
         return None
 
@@ -219,42 +390,13 @@ class MessageHandler:
 
         self.logger.info("Executing action", action_type=action_type, sender=sender)
 
-        try:
-            if action_type == "create":
-                # Extract task info from message
-                task_info = await self.claude_client.extract_task_info(
-                    action["message"]
-                )
-
-                # Create task in Linear
-                issue = await self.linear_client.create_issue(
-                    title=task_info.get("title", action["message"][:100]),
-                    description=action["message"]
-                )
-
-                self.logger.info(
-                    "Task created",
-                    issue_id=issue["id"],
-                    identifier=issue.get("identifier")
-                )
-
-                return {
-                    "type": "create",
-                    "identifier": issue.get("identifier"),
-                    "title": issue.get("title"),
-                    "url": issue.get("url")
-                }
-
-            elif action_type == "update":
-                # TODO: Implement update logic
-                pass
-
-            elif action_type == "complete":
-                # TODO: Implement completion logic
-                pass
-
+        handler = self._action_handlers.get(action_type)
+        if handler is None:
             return None
 
+        try:
+            return await handler(action, sender)
+
         except Exception as e:
             self.logger.error(
                 "Failed to execute action",
@@ -263,6 +405,54 @@ class MessageHandler:
             )
             return None
 
+    async def _do_create(
+        self,
+        action: Dict[str, Any],
+        sender: str
+    ) -> Optional[Dict[str, Any]]:
+        """Create a Linear issue from an extracted action."""
+        # Extract task info from message
+        task_info = await self.claude_client.extract_task_info(
+            action["message"]
+        )
+
+        # Create task in Linear
+        issue = await self.linear_client.create_issue(
+            title=task_info.get("title", action["message"][:100]),
+            description=action["message"]
+        )
+
+        self.logger.info(
+            "Task created",
+            issue_id=issue["id"],
+            identifier=issue.get("identifier")
+        )
+
+        return {
+            "type": "create",
+            "identifier": issue.get("identifier"),
+            "title": issue.get("title"),
+            "url": issue.get("url")
+        }
+
+    async def _do_update(
+        self,
+        action: Dict[str, Any],
+        sender: str
+    ) -> Optional[Dict[str, Any]]:
+        """Update a Linear issue from an extracted action."""
+        # TODO: Implement update logic
+        return None
+
+    async def _do_complete(
+        self,
+        action: Dict[str, Any],
+        sender: str
+    ) -> Optional[Dict[str, Any]]:
+        """Mark a Linear issue complete from an extracted action."""
+        # TODO: Implement completion logic
+        return None
+
     def _clean_response(self, response: str, action_result: Dict[str, Any]) -> str:
         """
         Clean Claude's response to remove technical details and add action results.
@@ -274,27 +464,31 @@ class MessageHandler:
         Returns:
             Cleaned, user-friendly response
         """
-        # Remove common technical patterns
-        import re
-
-        # Remove XML-like tags
-        cleaned = re.sub(r'<[^>]+>', '', response)
+        if not response:
+            return ""
 
-        # Remove JSON-like structures
-        cleaned = re.sub(r'\{[^}]+\}', '', cleaned)
+        # Plain-prose responses (the common case) skip the regex engine
+        # entirely; the single-char membership checks are C-level scans
+        has_markup = '<' in response or '{' in response or '```' in response
 
-        # Remove API-like responses
-        cleaned = re.sub(r'```[\s\S]*?```', '', cleaned)
+        # Remove XML-like tags, JSON-like structures and code fences in a
+        # single pass
+        cleaned = _STRIP_RE.sub('', response) if has_markup else response
 
         # If we have action results, append them nicely
         if action_result:
-            if action_result["type"] == "create":
+            result_type = action_result.get("type")
+            identifier = action_result.get("identifier")
+
+            if result_type == "create" and identifier:
                 # Append task identifier to response
-                if action_result["identifier"] not in cleaned:
-                    cleaned = f"{cleaned}\n\nTask created: {action_result['identifier']}"
+                if identifier not in cleaned:
+                    cleaned = f"{cleaned}\n\nTask created: {identifier}"
 
-        # Clean up extra whitespace
-        cleaned = re.sub(r'\n\s*\n\s*\n', '\n\n', cleaned)
+        # Collapse runs of blank lines; the literal str.replace loop missed
+        # blank lines that contain whitespace, so keep the precompiled
+        # pattern for this one substitution
+        cleaned = _BLANK_RUN_RE.sub('\n\n', cleaned)
         cleaned = cleaned.strip()
 
         return cleaned
@@ -1,17 +1,507 @@
 """Linear API client for task management."""
 
-import json
-from typing import Any, Dict, List, Optional
+import asyncio
+import logging
+import re
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import httpx
+import orjson
 
-from .config import LinearConfig
+from .config import LinearConfig, RetryConfig
 from .error_handler import ErrorSeverity, LinearError
+from .utils.http import create_async_client
 from .utils.logger import get_logger
-from .utils.retry import retry_decorator
 
 logger = get_logger(__name__)
 
+# Client errors that no amount of retrying will fix; failing fast avoids
+# burning the full backoff schedule on a permanent rejection
+_PERMANENT_STATUS_CODES = frozenset({400, 401, 403, 404, 422})
+
+# Parses a single-operation GraphQL document into (operation type, variable
+# declarations, body). Every query this client sends has exactly one
+# top-level field, which is what makes alias-based batching safe.
+_OPERATION_RE = re.compile(
+    r"^\s*(query|mutation)\s*\w*\s*(?:\(([^)]*)\))?\s*\{(.*)\}\s*$",
+    re.DOTALL
+)
+_VARIABLE_RE = re.compile(r"\$(\w+)")
+
+
+def _minify(query: str) -> str:
+    """Collapse a GraphQL document's whitespace into single spaces."""
+    return re.sub(r"\s+", " ", query).strip()
+
+
+@asynccontextmanager
+async def _wrap_errors(
+    operation: str,
+    severity: ErrorSeverity = ErrorSeverity.MEDIUM,
+    context: Optional[Dict[str, Any]] = None
+):
+    """
+    Wrap unexpected exceptions from an API operation in a LinearError.
+
+    Replaces the per-method try/except-isinstance boilerplate: LinearErrors
+    pass through untouched, anything else is wrapped with the operation's
+    severity and context.
+
+    Args:
+        operation: Short phrase describing the call, e.g. "create Linear issue"
+        severity: Severity to attach to wrapped errors
+        context: Context dict to attach to wrapped errors
+    """
+    try:
+        yield
+    except LinearError:
+        raise
+    except Exception as e:
+        raise LinearError(
+            f"Failed to {operation}: {str(e)}",
+            severity=severity,
+            original_error=e,
+            context=context
+        )
+
+
+# GraphQL documents, minified once at import: every request body shrinks to
+# roughly a third of its pretty-printed size and no per-call string work
+# remains on the hot path
+_ISSUE_CREATE_MUTATION = _minify("""
+    mutation IssueCreate($input: IssueCreateInput!) {
+        issueCreate(input: $input) {
+            success
+            issue {
+                id
+                identifier
+                title
+                description
+                priority
+                url
+                state {
+                    name
+                }
+                team {
+                    name
+                }
+            }
+        }
+    }
+""")
+
+_ISSUE_UPDATE_MUTATION = _minify("""
+    mutation IssueUpdate($id: String!, $input: IssueUpdateInput!) {
+        issueUpdate(id: $id, input: $input) {
+            success
+            issue {
+                id
+                identifier
+                title
+                description
+                priority
+                url
+                state {
+                    name
+                }
+            }
+        }
+    }
+""")
+
+_ISSUE_QUERY = _minify("""
+    query Issue($id: String!) {
+        issue(id: $id) {
+            id
+            identifier
+            title
+            description
+            priority
+            url
+            createdAt
+            updatedAt
+            state {
+                name
+                type
+            }
+            assignee {
+                id
+                name
+            }
+            team {
+                name
+            }
+        }
+    }
+""")
+
+# list_issues selection sets by detail level; most callers render a listing
+# and never touch descriptions or timestamps, so fetching only what they
+# read shrinks the response JSON substantially
+_ISSUES_QUERIES = {
+    "minimal": _minify("""
+        query Issues($filter: IssueFilter, $first: Int, $after: String) {
+            issues(filter: $filter, first: $first, after: $after) {
+                nodes {
+                    id
+                    identifier
+                    title
+                    url
+                }
+                pageInfo {
+                    hasNextPage
+                    endCursor
+                }
+            }
+        }
+    """),
+    "summary": _minify("""
+        query Issues($filter: IssueFilter, $first: Int, $after: String) {
+            issues(filter: $filter, first: $first, after: $after) {
+                nodes {
+                    id
+                    identifier
+                    title
+                    priority
+                    url
+                    state {
+                        name
+                        type
+                    }
+                }
+                pageInfo {
+                    hasNextPage
+                    endCursor
+                }
+            }
+        }
+    """),
+    "full": _minify("""
+        query Issues($filter: IssueFilter, $first: Int, $after: String) {
+            issues(filter: $filter, first: $first, after: $after) {
+                nodes {
+                    id
+                    identifier
+                    title
+                    description
+                    priority
+                    url
+                    createdAt
+                    updatedAt
+                    state {
+                        name
+                        type
+                    }
+                    assignee {
+                        id
+                        name
+                    }
+                    team {
+                        name
+                    }
+                }
+                pageInfo {
+                    hasNextPage
+                    endCursor
+                }
+            }
+        }
+    """),
+}
+
+_ISSUE_SEARCH_QUERY = _minify("""
+    query SearchIssues($query: String!, $first: Int) {
+        issueSearch(query: $query, first: $first) {
+            nodes {
+                id
+                identifier
+                title
+                description
+                priority
+                url
+                state {
+                    name
+                    type
+                }
+                team {
+                    name
+                }
+            }
+        }
+    }
+""")
+
+_WORKFLOW_STATES_QUERY = _minify("""
+    query WorkflowStates($teamId: String!) {
+        team(id: $teamId) {
+            states {
+                nodes {
+                    id
+                    name
+                    type
+                    position
+                }
+            }
+        }
+    }
+""")
+
+
+class _RateLimiter:
+    """
+    Token-bucket limiter whose refill rate tracks Linear's X-RateLimit-*
+    response headers.
+
+    Staying under the server's advertised budget avoids 429 responses
+    entirely, which is far cheaper than burning retry backoff on them.
+    """
+
+    def __init__(self, rate: float = 20.0, capacity: float = 20.0):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate: Initial refill rate in requests per second
+            capacity: Maximum burst size in requests
+        """
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "_RateLimiter":
+        await self._acquire()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+    async def _acquire(self) -> None:
+        """Take one token, sleeping until the bucket refills if empty."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+
+                await asyncio.sleep((1.0 - self._tokens) / self._rate)
+
+    def update_from_headers(self, headers) -> None:
+        """
+        Adapt the refill rate to the server's advertised remaining budget.
+
+        Args:
+            headers: Response headers from a Linear API call
+        """
+        remaining = headers.get("X-RateLimit-Requests-Remaining")
+        reset = headers.get("X-RateLimit-Requests-Reset")
+
+        if remaining is None or reset is None:
+            return
+
+        try:
+            remaining_count = float(remaining)
+            reset_at = float(reset) / 1000.0  # Unix timestamp in ms
+        except ValueError:
+            return
+
+        # Spread the remaining budget over the rest of the window, keeping
+        # a small positive floor so the bucket always drains eventually
+        window = max(reset_at - time.time(), 1.0)
+        self._rate = max(remaining_count / window, 0.1)
+
+
+class _BatchScheduler:
+    """
+    Coalesces GraphQL requests arriving within a short window into a single
+    HTTP POST using alias-prefixed operations.
+
+    Queries and mutations are flushed as separate batches since they cannot
+    share one operation. Requests that cannot be parsed for merging are sent
+    individually.
+    """
+
+    def __init__(self, post, delay: float = 0.01, max_batch: int = 10):
+        """
+        Initialize the scheduler.
+
+        Args:
+            post: Coroutine function accepting a payload dict and returning
+                the parsed GraphQL response
+            delay: Coalescing window in seconds
+            max_batch: Flush immediately once this many requests are pending
+        """
+        self._post = post
+        self._delay = delay
+        self._max_batch = max_batch
+        self._pending: Dict[str, list] = {"query": [], "mutation": []}
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def execute(self, query: str, variables: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Submit a request for batched execution and await its result.
+
+        Args:
+            query: GraphQL document with a single top-level field
+            variables: Query variables
+
+        Returns:
+            The "data" portion of the response for this request
+        """
+        parsed = _OPERATION_RE.match(query)
+        if not parsed:
+            # Unmergeable document; send it on its own
+            return self._check_errors(await self._post(self._payload(query, variables)))
+
+        op_type = parsed.group(1)
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending[op_type].append((parsed, variables, future))
+
+        if sum(len(items) for items in self._pending.values()) >= self._max_batch:
+            self._cancel_scheduled_flush()
+            # Shielded so a cancelled caller (e.g. an outer timeout) cannot
+            # abandon the batch after its items have been popped, which
+            # would strand every other waiter on unresolved futures
+            await asyncio.shield(self._flush())
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._delayed_flush())
+
+        return await future
+
+    @staticmethod
+    def _payload(query: str, variables: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build a GraphQL request payload."""
+        payload: Dict[str, Any] = {"query": query}
+        if variables:
+            payload["variables"] = variables
+        return payload
+
+    @staticmethod
+    def _check_errors(result: Dict[str, Any]) -> Dict[str, Any]:
+        """Raise on GraphQL errors, otherwise return the data portion."""
+        if "errors" in result:
+            error_msg = result["errors"][0].get("message", "Unknown error")
+            raise LinearError(
+                f"Linear API error: {error_msg}",
+                severity=ErrorSeverity.HIGH,
+                context={"errors": result["errors"]}
+            )
+        return result.get("data", {})
+
+    def _cancel_scheduled_flush(self) -> None:
+        """Cancel a pending delayed flush, if any."""
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        self._flush_task = None
+
+    async def _delayed_flush(self) -> None:
+        """Wait out the coalescing window, then flush pending requests."""
+        await asyncio.sleep(self._delay)
+        # Shielded: a size-triggered flush cancels this task, and once the
+        # sleep has completed a bare CancelledError mid-send would leave
+        # the popped items' futures unresolved forever
+        await asyncio.shield(self._flush())
+
+    async def _flush(self) -> None:
+        """Send all pending requests, one POST per operation type."""
+        for op_type in ("query", "mutation"):
+            items = self._pending[op_type]
+            if not items:
+                continue
+            self._pending[op_type] = []
+            await self._send_batch(op_type, items)
+
+    async def _send_batch(self, op_type: str, items: list) -> None:
+        """
+        Merge pending items into one aliased operation and distribute results.
+
+        Args:
+            op_type: "query" or "mutation"
+            items: List of (parsed match, variables, future) tuples
+        """
+        if len(items) == 1:
+            parsed, variables, future = items[0]
+            try:
+                result = self._check_errors(
+                    await self._post(self._payload(parsed.group(0), variables))
+                )
+                if not future.done():
+                    future.set_result(result)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        declarations = []
+        selections = []
+        merged_variables: Dict[str, Any] = {}
+        field_names = []
+
+        for index, (parsed, variables, _) in enumerate(items):
+            prefix = f"b{index}_"
+            rename = lambda m: f"${prefix}{m.group(1)}"  # noqa: E731
+
+            if parsed.group(2):
+                declarations.append(_VARIABLE_RE.sub(rename, parsed.group(2)))
+
+            body = _VARIABLE_RE.sub(rename, parsed.group(3)).strip()
+            selections.append(f"b{index}: {body}")
+            field_names.append(re.match(r"\w+", body).group(0))
+
+            for name, value in (variables or {}).items():
+                merged_variables[f"{prefix}{name}"] = value
+
+        document = (
+            f"{op_type} Batch"
+            + (f"({', '.join(declarations)})" if declarations else "")
+            + " { " + " ".join(selections) + " }"
+        )
+
+        try:
+            result = await self._post(self._payload(document, merged_variables))
+        except Exception as e:
+            for _, _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        data = result.get("data") or {}
+        errors_by_alias: Dict[str, list] = {}
+        global_errors = []
+
+        for error in result.get("errors", []):
+            path = error.get("path") or []
+            if path and isinstance(path[0], str):
+                errors_by_alias.setdefault(path[0], []).append(error)
+            else:
+                global_errors.append(error)
+
+        for index, (_, _, future) in enumerate(items):
+            alias = f"b{index}"
+            # A waiter cancelled mid-flight leaves its future done; skip it
+            # so distribution still reaches the rest of the batch
+            if future.done():
+                continue
+            item_errors = errors_by_alias.get(alias, []) + global_errors
+            if item_errors:
+                future.set_exception(LinearError(
+                    f"Linear API error: {item_errors[0].get('message', 'Unknown error')}",
+                    severity=ErrorSeverity.HIGH,
+                    context={"errors": item_errors}
+                ))
+            else:
+                future.set_result({field_names[index]: data.get(alias)})
+
 
 class LinearClient:
     """
@@ -20,69 +510,226 @@ class LinearClient:
 
     GRAPHQL_ENDPOINT = "https://api.linear.app/graphql"
 
-    def __init__(self, config: LinearConfig, retry_config: dict):
+    # Workflow states effectively never change at runtime; issue reads are
+    # cached just long enough for a burst of messages to share one fetch
+    WORKFLOW_STATES_TTL = 600.0
+    ISSUE_TTL = 5.0
+
+    def __init__(
+        self,
+        config: LinearConfig,
+        retry_config: RetryConfig,
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
         """
         Initialize Linear client.
 
         Args:
             config: Linear configuration
-            retry_config: Retry configuration dict
+            retry_config: Retry configuration
+            http_client: Shared HTTP client to use (one is created if omitted)
         """
         self.config = config
         self.retry_config = retry_config
         self.logger = get_logger(__name__)
 
-        # Initialize HTTP client
-        self.client = httpx.AsyncClient(
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": config.api_key or ""
-            },
-            timeout=30.0
-        )
+        # Resolved once so hot-path logs skip kwargs and f-string work
+        # entirely when INFO is filtered out. The stdlib logger is
+        # consulted because structlog's default wrapper (used before
+        # setup_logging configures it) has no isEnabledFor.
+        self._info_enabled = logging.getLogger(__name__).isEnabledFor(logging.INFO)
+
+        # Auth headers ride on each request so the client itself can be a
+        # process-wide pool shared with other API clients
+        self._headers = {
+            "Content-Type": "application/json",
+            "Authorization": config.api_key or ""
+        }
+        self._timeout = httpx.Timeout(connect=5.0, read=30.0, write=10.0, pool=5.0)
+
+        # HTTP/2 multiplexes concurrent GraphQL calls over one TLS
+        # connection to Linear's single host, and the enlarged keep-alive
+        # pool avoids per-call handshakes under load
+        if http_client is not None:
+            self.client = http_client
+        else:
+            self.client = create_async_client(
+                limits=httpx.Limits(
+                    max_connections=64,
+                    max_keepalive_connections=32,
+                    keepalive_expiry=60.0
+                ),
+                timeout=self._timeout
+            )
 
-    async def _execute_query(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        # Coalesces concurrent GraphQL calls into single HTTP round trips
+        self._batch_scheduler = _BatchScheduler(self._post_payload)
+
+        # Client-side pacing tuned by Linear's rate-limit response headers
+        self._rate_limiter = _RateLimiter()
+
+        # Static portion of every issueCreate input, resolved once; each
+        # call then copies it and adds only the dynamic fields
+        self._create_input_base: Dict[str, Any] = {"teamId": config.team_id}
+        if config.default_project_id:
+            self._create_input_base["projectId"] = config.default_project_id
+
+        # Read-through response cache keyed by (method name, args), with a
+        # per-key lock so concurrent misses coalesce into one API call
+        self._cache: Dict[Tuple, Tuple[float, Any]] = {}
+        self._cache_locks: Dict[Tuple, asyncio.Lock] = {}
+
+        # Resolved once on first completion; only changes if an admin edits
+        # the team's workflow, in which case invalidate_workflow_cache()
+        # forces a re-scan
+        self._completed_state_id: Optional[str] = None
+
+    async def _cached(self, key: Tuple, ttl: float, fetch) -> Any:
         """
-        Execute a GraphQL query against Linear API.
+        Return a cached result for key, fetching on miss or expiry.
 
         Args:
-            query: GraphQL query string
-            variables: Query variables
+            key: Cache key (method name, args)
+            ttl: Time-to-live in seconds
+            fetch: Zero-argument coroutine function performing the real call
 
         Returns:
-            Query response data
+            Cached or freshly fetched value
+        """
+        entry = self._cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+
+        lock = self._cache_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Re-check after acquiring the lock: the caller we waited on may
+            # have populated the entry (single-flight on miss)
+            entry = self._cache.get(key)
+            if entry is not None and time.monotonic() - entry[0] < ttl:
+                return entry[1]
+
+            value = await fetch()
+            self._cache[key] = (time.monotonic(), value)
+            return value
+
+    def _invalidate(self, key: Tuple) -> None:
+        """Drop a cache entry after a mutation makes it stale."""
+        self._cache.pop(key, None)
+
+    async def _call_with_retry(self, func, *args) -> Any:
+        """
+        Await func(*args), retrying per self.retry_config.
+
+        Permanent client errors (4xx validation/auth/not-found) are raised
+        immediately instead of wasting the backoff schedule on them.
+
+        Args:
+            func: Coroutine method performing the API call
+            *args: Arguments forwarded to func
+
+        Returns:
+            The call's result
 
         Raises:
-            LinearError: If query fails
+            LinearError: The last error once retries are exhausted
+        """
+        max_attempts = self.retry_config.max_attempts
+        base_delay = self.retry_config.base_delay
+        max_delay = self.retry_config.max_delay
+        exponential = self.retry_config.exponential_backoff
+
+        for attempt in range(1, max_attempts + 1):
+            try:
+                return await func(*args)
+
+            except LinearError as e:
+                status = e.context.get("status_code") if e.context else None
+
+                if status in _PERMANENT_STATUS_CODES or attempt == max_attempts:
+                    raise
+
+                if exponential:
+                    delay = min(base_delay * (2 ** (attempt - 1)), max_delay)
+                else:
+                    delay = base_delay
+
+                self.logger.warning(
+                    "Linear call failed, retrying",
+                    function=func.__name__,
+                    attempt=attempt,
+                    max_attempts=max_attempts,
+                    error=str(e),
+                    retry_delay=delay
+                )
+
+                await asyncio.sleep(delay)
+
+    async def prime_workflow_cache(self) -> None:
+        """
+        Warm the workflow-state cache and completed-state id ahead of use.
+
+        Run as a fire-and-forget task at startup so the first completion
+        pays no extra round trip. Failures are logged and the lazy path in
+        mark_issue_complete remains the fallback.
         """
         try:
-            payload = {"query": query}
-            if variables:
-                payload["variables"] = variables
+            states = await self.get_workflow_states()
+
+            for state in states:
+                if state.get("type") == "completed":
+                    self._completed_state_id = state["id"]
+                    break
 
-            response = await self.client.post(
-                self.GRAPHQL_ENDPOINT,
-                json=payload
+        except Exception as e:
+            self.logger.warning(
+                "Failed to prime workflow cache",
+                error=str(e)
             )
 
-            if response.status_code != 200:
-                raise LinearError(
-                    f"Linear API returned status {response.status_code}",
-                    severity=ErrorSeverity.HIGH,
-                    context={"status_code": response.status_code}
+    def invalidate_workflow_cache(self) -> None:
+        """
+        Force the next workflow-state lookup to hit the API.
+
+        Call after a team's workflow is reconfigured in Linear.
+        """
+        self._completed_state_id = None
+        for key in [k for k in self._cache if k[0] == "get_workflow_states"]:
+            self._cache.pop(key, None)
+
+    async def _post_payload(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        POST a GraphQL payload and return the parsed response body.
+
+        Args:
+            payload: Request payload with "query" and optional "variables"
+
+        Returns:
+            Parsed response body, including any "errors" key
+
+        Raises:
+            LinearError: If the HTTP exchange fails
+        """
+        try:
+            # orjson serializes to bytes and parses from bytes directly,
+            # skipping the str round trips of the stdlib json path
+            async with self._rate_limiter:
+                response = await self.client.post(
+                    self.GRAPHQL_ENDPOINT,
+                    content=orjson.dumps(payload),
+                    headers=self._headers,
+                    timeout=self._timeout
                 )
 
-            data = response.json()
+            self._rate_limiter.update_from_headers(response.headers)
 
-            if "errors" in data:
-                error_msg = data["errors"][0].get("message", "Unknown error")
+            if response.status_code != 200:
                 raise LinearError(
-                    f"Linear API error: {error_msg}",
+                    f"Linear API returned status {response.status_code}",
                     severity=ErrorSeverity.HIGH,
-                    context={"errors": data["errors"]}
+                    context={"status_code": response.status_code}
                 )
 
-            return data.get("data", {})
+            return orjson.loads(response.content)
 
         except httpx.HTTPError as e:
             raise LinearError(
@@ -99,7 +746,24 @@ class LinearClient:
                 original_error=e
             )
 
-    @retry_decorator(max_attempts=3, base_delay=1.0, exponential_backoff=True)
+    async def _execute_query(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Execute a GraphQL query against Linear API.
+
+        Concurrent calls within the coalescing window share one HTTP POST.
+
+        Args:
+            query: GraphQL query string
+            variables: Query variables
+
+        Returns:
+            Query response data
+
+        Raises:
+            LinearError: If query fails
+        """
+        return await self._batch_scheduler.execute(query, variables)
+
     async def create_issue(
         self,
         title: str,
@@ -126,50 +790,43 @@ class LinearClient:
         Raises:
             LinearError: If issue creation fails
         """
-        try:
-            query = """
-            mutation IssueCreate($input: IssueCreateInput!) {
-                issueCreate(input: $input) {
-                    success
-                    issue {
-                        id
-                        identifier
-                        title
-                        description
-                        priority
-                        url
-                        state {
-                            name
-                        }
-                        team {
-                            name
-                        }
-                    }
-                }
-            }
-            """
+        return await self._call_with_retry(
+            self._create_issue,
+            title, description, priority, labels, assignee_id, project_id
+        )
 
-            variables = {
-                "input": {
-                    "title": title,
-                    "teamId": self.config.team_id,
-                }
-            }
+    async def _create_issue(
+        self,
+        title: str,
+        description: Optional[str],
+        priority: int,
+        labels: Optional[List[str]],
+        assignee_id: Optional[str],
+        project_id: Optional[str]
+    ) -> Dict[str, Any]:
+        """Perform a single issue-creation attempt."""
+        async with _wrap_errors("create Linear issue", ErrorSeverity.HIGH, {"title": title}):
+            query = _ISSUE_CREATE_MUTATION
+
+            input_obj = dict(self._create_input_base)
+            input_obj["title"] = title
 
             if description:
-                variables["input"]["description"] = description
+                input_obj["description"] = description
 
             if priority > 0:
-                variables["input"]["priority"] = priority
+                input_obj["priority"] = priority
 
             if assignee_id:
-                variables["input"]["assigneeId"] = assignee_id
+                input_obj["assigneeId"] = assignee_id
 
-            if project_id or self.config.default_project_id:
-                variables["input"]["projectId"] = project_id or self.config.default_project_id
+            if project_id:
+                input_obj["projectId"] = project_id
 
             if labels:
-                variables["input"]["labelIds"] = labels
+                input_obj["labelIds"] = labels
+
+            variables = {"input": input_obj}
 
             self.logger.info("Creating Linear issue", title=title)
 
@@ -195,17 +852,6 @@ class LinearClient:
 
             return issue
 
-        except Exception as e:
-            if isinstance(e, LinearError):
-                raise
-            raise LinearError(
-                f"Failed to create Linear issue: {str(e)}",
-                severity=ErrorSeverity.HIGH,
-                original_error=e,
-                context={"title": title}
-            )
-
-    @retry_decorator(max_attempts=3, base_delay=1.0, exponential_backoff=True)
     async def update_issue(
         self,
         issue_id: str,
@@ -234,25 +880,24 @@ class LinearClient:
         Raises:
             LinearError: If update fails
         """
-        try:
-            query = """
-            mutation IssueUpdate($id: String!, $input: IssueUpdateInput!) {
-                issueUpdate(id: $id, input: $input) {
-                    success
-                    issue {
-                        id
-                        identifier
-                        title
-                        description
-                        priority
-                        url
-                        state {
-                            name
-                        }
-                    }
-                }
-            }
-            """
+        return await self._call_with_retry(
+            self._update_issue,
+            issue_id, title, description, state_id, priority, labels, assignee_id
+        )
+
+    async def _update_issue(
+        self,
+        issue_id: str,
+        title: Optional[str],
+        description: Optional[str],
+        state_id: Optional[str],
+        priority: Optional[int],
+        labels: Optional[List[str]],
+        assignee_id: Optional[str]
+    ) -> Dict[str, Any]:
+        """Perform a single issue-update attempt."""
+        async with _wrap_errors("update Linear issue", context={"issue_id": issue_id}):
+            query = _ISSUE_UPDATE_MUTATION
 
             update_input = {}
 
@@ -289,25 +934,20 @@ class LinearClient:
 
             issue = result.get("issue", {})
 
+            # The cached read (if any) is now stale
+            self._invalidate(("get_issue", issue_id))
+
             self.logger.info("Issue updated successfully", issue_id=issue_id)
 
             return issue
 
-        except Exception as e:
-            if isinstance(e, LinearError):
-                raise
-            raise LinearError(
-                f"Failed to update Linear issue: {str(e)}",
-                severity=ErrorSeverity.MEDIUM,
-                original_error=e,
-                context={"issue_id": issue_id}
-            )
-
-    @retry_decorator(max_attempts=3, base_delay=1.0, exponential_backoff=True)
     async def get_issue(self, issue_id: str) -> Dict[str, Any]:
         """
         Get issue details by ID.
 
+        Results are cached briefly (ISSUE_TTL) so bursts of reads for the
+        same issue share one API call; mutations invalidate the entry.
+
         Args:
             issue_id: Issue ID
 
@@ -317,36 +957,21 @@ class LinearClient:
         Raises:
             LinearError: If fetch fails
         """
-        try:
-            query = """
-            query Issue($id: String!) {
-                issue(id: $id) {
-                    id
-                    identifier
-                    title
-                    description
-                    priority
-                    url
-                    createdAt
-                    updatedAt
-                    state {
-                        name
-                        type
-                    }
-                    assignee {
-                        id
-                        name
-                    }
-                    team {
-                        name
-                    }
-                }
-            }
-            """
+        return await self._cached(
+            ("get_issue", issue_id),
+            self.ISSUE_TTL,
+            lambda: self._call_with_retry(self._fetch_issue, issue_id)
+        )
+
+    async def _fetch_issue(self, issue_id: str) -> Dict[str, Any]:
+        """Fetch issue details from the API (cache miss path)."""
+        async with _wrap_errors("get Linear issue", context={"issue_id": issue_id}):
+            query = _ISSUE_QUERY
 
             variables = {"id": issue_id}
 
-            self.logger.info("Fetching Linear issue", issue_id=issue_id)
+            if self._info_enabled:
+                self.logger.info("Fetching Linear issue", issue_id=issue_id)
 
             data = await self._execute_query(query, variables)
 
@@ -361,23 +986,51 @@ class LinearClient:
 
             return issue
 
-        except Exception as e:
-            if isinstance(e, LinearError):
-                raise
-            raise LinearError(
-                f"Failed to get Linear issue: {str(e)}",
-                severity=ErrorSeverity.MEDIUM,
-                original_error=e,
-                context={"issue_id": issue_id}
-            )
+    async def _list_issues_page(
+        self,
+        team_id: Optional[str],
+        assignee_id: Optional[str],
+        state_id: Optional[str],
+        limit: int,
+        after: Optional[str],
+        fields: str
+    ) -> Dict[str, Any]:
+        """Fetch one page of issues; returns the issues connection."""
+        async with _wrap_errors("list Linear issues"):
+            query = _ISSUES_QUERIES[fields]
+
+            filter_obj = {}
+
+            if team_id or self.config.team_id:
+                filter_obj["team"] = {"id": {"eq": team_id or self.config.team_id}}
+
+            if assignee_id:
+                filter_obj["assignee"] = {"id": {"eq": assignee_id}}
+
+            if state_id:
+                filter_obj["state"] = {"id": {"eq": state_id}}
+
+            variables = {
+                "filter": filter_obj if filter_obj else None,
+                "first": limit,
+                "after": after
+            }
+
+            if self._info_enabled:
+                self.logger.info("Listing Linear issues", filter=filter_obj, limit=limit)
+
+            data = await self._execute_query(query, variables)
+
+            return data.get("issues") or {}
 
-    @retry_decorator(max_attempts=3, base_delay=1.0, exponential_backoff=True)
     async def list_issues(
         self,
         team_id: Optional[str] = None,
         assignee_id: Optional[str] = None,
         state_id: Optional[str] = None,
-        limit: int = 50
+        limit: int = 50,
+        after: Optional[str] = None,
+        fields: str = "summary"
     ) -> List[Dict[str, Any]]:
         """
         List issues with optional filters.
@@ -387,6 +1040,9 @@ class LinearClient:
             assignee_id: Filter by assignee ID
             state_id: Filter by state ID
             limit: Maximum number of issues to return
+            after: Pagination cursor from a previous page's endCursor
+            fields: Detail level: "minimal" (id/identifier/title/url),
+                "summary" (adds priority and state) or "full" (everything)
 
         Returns:
             List of issues
@@ -394,76 +1050,68 @@ class LinearClient:
         Raises:
             LinearError: If fetch fails
         """
-        try:
-            query = """
-            query Issues($filter: IssueFilter, $first: Int) {
-                issues(filter: $filter, first: $first) {
-                    nodes {
-                        id
-                        identifier
-                        title
-                        description
-                        priority
-                        url
-                        createdAt
-                        updatedAt
-                        state {
-                            name
-                            type
-                        }
-                        assignee {
-                            id
-                            name
-                        }
-                        team {
-                            name
-                        }
-                    }
-                }
-            }
-            """
+        page = await self._call_with_retry(
+            self._list_issues_page,
+            team_id, assignee_id, state_id, limit, after, fields
+        )
 
-            filter_obj = {}
+        issues = page.get("nodes", [])
 
-            if team_id or self.config.team_id:
-                filter_obj["team"] = {"id": {"eq": team_id or self.config.team_id}}
+        if self._info_enabled:
+            self.logger.info(f"Retrieved {len(issues)} issues")
 
-            if assignee_id:
-                filter_obj["assignee"] = {"id": {"eq": assignee_id}}
+        return issues
 
-            if state_id:
-                filter_obj["state"] = {"id": {"eq": state_id}}
+    async def iter_all_issues(
+        self,
+        team_id: Optional[str] = None,
+        assignee_id: Optional[str] = None,
+        state_id: Optional[str] = None,
+        page_size: int = 50,
+        fields: str = "summary"
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield issues page by page, following the pagination cursor.
 
-            variables = {
-                "filter": filter_obj if filter_obj else None,
-                "first": limit
-            }
+        Callers scanning for a match can break early and never pay for the
+        remaining pages.
 
-            self.logger.info("Listing Linear issues", filter=filter_obj, limit=limit)
+        Args:
+            team_id: Filter by team ID
+            assignee_id: Filter by assignee ID
+            state_id: Filter by state ID
+            page_size: Issues to fetch per request
+            fields: Detail level as in list_issues
 
-            data = await self._execute_query(query, variables)
+        Yields:
+            Issue dictionaries
 
-            issues = data.get("issues", {}).get("nodes", [])
+        Raises:
+            LinearError: If a page fetch fails
+        """
+        after: Optional[str] = None
 
-            self.logger.info(f"Retrieved {len(issues)} issues")
+        while True:
+            page = await self._call_with_retry(
+                self._list_issues_page,
+                team_id, assignee_id, state_id, page_size, after, fields
+            )
 
-            return issues
+            for issue in page.get("nodes", []):
+                yield issue
 
-        except Exception as e:
-            if isinstance(e, LinearError):
-                raise
-            raise LinearError(
-                f"Failed to list Linear issues: {str(e)}",
-                severity=ErrorSeverity.MEDIUM,
-                original_error=e
-            )
+            page_info = page.get("pageInfo") or {}
+            if not page_info.get("hasNextPage"):
+                return
+            after = page_info.get("endCursor")
 
-    async def search_issues(self, query: str) -> List[Dict[str, Any]]:
+    async def search_issues(self, query: str, first: int = 25) -> List[Dict[str, Any]]:
         """
         Search issues by text query.
 
         Args:
             query: Search query
+            first: Maximum number of results to return
 
         Returns:
             List of matching issues
@@ -471,30 +1119,10 @@ class LinearClient:
         Raises:
             LinearError: If search fails
         """
-        try:
-            graphql_query = """
-            query SearchIssues($query: String!) {
-                issueSearch(query: $query) {
-                    nodes {
-                        id
-                        identifier
-                        title
-                        description
-                        priority
-                        url
-                        state {
-                            name
-                            type
-                        }
-                        team {
-                            name
-                        }
-                    }
-                }
-            }
-            """
+        async with _wrap_errors("search Linear issues", context={"query": query}):
+            graphql_query = _ISSUE_SEARCH_QUERY
 
-            variables = {"query": query}
+            variables = {"query": query, "first": first}
 
             self.logger.info("Searching Linear issues", query=query)
 
@@ -502,24 +1130,18 @@ class LinearClient:
 
             issues = data.get("issueSearch", {}).get("nodes", [])
 
-            self.logger.info(f"Found {len(issues)} issues matching query")
+            if self._info_enabled:
+                self.logger.info(f"Found {len(issues)} issues matching query")
 
             return issues
 
-        except Exception as e:
-            if isinstance(e, LinearError):
-                raise
-            raise LinearError(
-                f"Failed to search Linear issues: {str(e)}",
-                severity=ErrorSeverity.MEDIUM,
-                original_error=e,
-                context={"query": query}
-            )
-
     async def get_workflow_states(self, team_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Get workflow states for a team.
 
+        States are cached for WORKFLOW_STATES_TTL seconds; they only change
+        when someone edits the team's workflow in Linear.
+
         Args:
             team_id: Team ID (defaults to configured team)
 
@@ -529,23 +1151,19 @@ class LinearClient:
         Raises:
             LinearError: If fetch fails
         """
-        try:
-            query = """
-            query WorkflowStates($teamId: String!) {
-                team(id: $teamId) {
-                    states {
-                        nodes {
-                            id
-                            name
-                            type
-                            position
-                        }
-                    }
-                }
-            }
-            """
+        resolved_team_id = team_id or self.config.team_id
+        return await self._cached(
+            ("get_workflow_states", resolved_team_id),
+            self.WORKFLOW_STATES_TTL,
+            lambda: self._fetch_workflow_states(resolved_team_id)
+        )
+
+    async def _fetch_workflow_states(self, team_id: str) -> List[Dict[str, Any]]:
+        """Fetch workflow states from the API (cache miss path)."""
+        async with _wrap_errors("get workflow states"):
+            query = _WORKFLOW_STATES_QUERY
 
-            variables = {"teamId": team_id or self.config.team_id}
+            variables = {"teamId": team_id}
 
             data = await self._execute_query(query, variables)
 
@@ -553,15 +1171,6 @@ class LinearClient:
 
             return states
 
-        except Exception as e:
-            if isinstance(e, LinearError):
-                raise
-            raise LinearError(
-                f"Failed to get workflow states: {str(e)}",
-                severity=ErrorSeverity.MEDIUM,
-                original_error=e
-            )
-
     async def mark_issue_complete(self, issue_id: str) -> Dict[str, Any]:
         """
         Mark an issue as complete.
@@ -575,35 +1184,29 @@ class LinearClient:
         Raises:
             LinearError: If update fails
         """
-        try:
-            # First get workflow states to find "Done" or "Completed"
-            states = await self.get_workflow_states()
-
-            completed_state = None
-            for state in states:
-                if state.get("type") == "completed":
-                    completed_state = state
-                    break
-
-            if not completed_state:
-                raise LinearError(
-                    "No completed state found in workflow",
-                    severity=ErrorSeverity.MEDIUM,
-                    context={"issue_id": issue_id}
-                )
+        async with _wrap_errors("mark issue as complete", context={"issue_id": issue_id}):
+            # Resolve the "completed" state once and reuse it; completions
+            # then cost a single round trip (the update itself)
+            if self._completed_state_id is None:
+                states = await self.get_workflow_states()
+
+                completed_state = None
+                for state in states:
+                    if state.get("type") == "completed":
+                        completed_state = state
+                        break
+
+                if not completed_state:
+                    raise LinearError(
+                        "No completed state found in workflow",
+                        severity=ErrorSeverity.MEDIUM,
+                        context={"issue_id": issue_id}
+                    )
+
+                self._completed_state_id = completed_state["id"]
 
             # Update issue to completed state
             return await self.update_issue(
                 issue_id=issue_id,
-                state_id=completed_state["id"]
-            )
-
-        except Exception as e:
-            if isinstance(e, LinearError):
-                raise
-            raise LinearError(
-                f"Failed to mark issue as complete: {str(e)}",
-                severity=ErrorSeverity.MEDIUM,
-                original_error=e,
-                context={"issue_id": issue_id}
+                state_id=self._completed_state_id
             )
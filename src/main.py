@@ -1,6 +1,8 @@
 """Main entry point for the agentic todo system."""
 
 import asyncio
+import logging
+import random
 import signal as signal_module
 import sys
 from pathlib import Path
@@ -11,8 +13,9 @@ from .config import Config
 from .error_handler import ErrorHandler
 from .handlers.message_handler import MessageHandler
 from .linear_client import LinearClient
-from .queue_manager import QueueManager
+from .queue_manager import MessageMetadata, QueueManager
 from .signal_client import SignalClient, SignalMessage
+from .utils.http import create_async_client
 from .utils.logger import get_logger, setup_logging
 
 logger = get_logger(__name__)
@@ -41,6 +44,12 @@ class AgenticTodoApp:
         self.logger = get_logger(__name__)
         self.logger.info("Initializing Agentic Todo application")
 
+        # Resolved once: per-message logs skip kwargs/slice construction
+        # entirely when INFO is filtered out. The stdlib logger is
+        # consulted because structlog's default wrapper (used before
+        # setup_logging configures it) has no isEnabledFor.
+        self._info_enabled = logging.getLogger(__name__).isEnabledFor(logging.INFO)
+
         # Validate configuration
         try:
             self.config.validate()
@@ -48,17 +57,20 @@ class AgenticTodoApp:
             self.logger.critical(f"Configuration validation failed: {e}")
             sys.exit(1)
 
-        # Initialize clients
-        retry_config = {
-            "max_attempts": self.config.retry.max_attempts,
-            "base_delay": self.config.retry.base_delay,
-            "max_delay": self.config.retry.max_delay,
-            "exponential_backoff": self.config.retry.exponential_backoff
-        }
+        # One process-wide HTTP pool: a single TLS context and DNS cache
+        # shared by the Linear and Claude clients, with HTTP/2 multiplexing
+        # per host. SignalClient shells out to signal-cli and does no HTTP.
+        self._http = create_async_client()
 
-        self.signal_client = SignalClient(self.config.signal, retry_config)
-        self.linear_client = LinearClient(self.config.linear, retry_config)
-        self.claude_client = ClaudeClient(self.config.claude, retry_config)
+        # Initialize clients; they share the typed RetryConfig directly
+        # instead of a rebuilt (and aliased-mutable) dict copy of it
+        self.signal_client = SignalClient(self.config.signal, self.config.retry)
+        self.linear_client = LinearClient(
+            self.config.linear, self.config.retry, http_client=self._http
+        )
+        self.claude_client = ClaudeClient(
+            self.config.claude, self.config.retry, http_client=self._http
+        )
 
         # Initialize error handler
         self.error_handler = ErrorHandler(
@@ -84,10 +96,15 @@ class AgenticTodoApp:
         # Shutdown flag
         self.shutdown_event = asyncio.Event()
 
+        # Bounds concurrent enqueues when Signal delivers a burst
+        self._enqueue_semaphore = asyncio.Semaphore(self.config.queue.max_workers)
+
     async def process_signal_messages(self) -> None:
         """Poll for and process incoming Signal messages."""
         self.logger.info("Starting Signal message polling")
 
+        backoff = 1.0
+
         while not self.shutdown_event.is_set():
             try:
                 # Receive messages from Signal
@@ -95,39 +112,28 @@ class AgenticTodoApp:
                     timeout=self.config.signal.poll_interval
                 )
 
-                # Enqueue each message for processing
-                for msg in messages:
-                    try:
-                        await self.queue_manager.enqueue(
-                            sender=msg.sender,
-                            text=msg.text,
-                            timestamp=msg.timestamp,
-                            metadata={
-                                "group_id": msg.group_id,
-                                "attachments": msg.attachments
-                            }
-                        )
-
-                        self.logger.info(
-                            "Message enqueued",
-                            sender=msg.sender,
-                            text_preview=msg.text[:50]
-                        )
-
-                    except asyncio.QueueFull:
-                        self.logger.error(
-                            "Queue full, cannot process message",
-                            sender=msg.sender
-                        )
-
-                        # Send error notification to user
-                        await self.signal_client.send_error_notification(
-                            msg.sender,
-                            "⚠️ System is currently busy. Please try again in a few moments."
-                        )
-
-                # Small delay between polls
-                await asyncio.sleep(1.0)
+                backoff = 1.0
+
+                # Enqueue the batch concurrently; each enqueue is an
+                # independent I/O round trip, so a burst completes in the
+                # time of the slowest rather than the sum
+                if messages:
+                    results = await asyncio.gather(
+                        *(self._enqueue_one(msg) for msg in messages),
+                        return_exceptions=True
+                    )
+                    for msg, result in zip(messages, results):
+                        if isinstance(result, Exception):
+                            self.logger.error(
+                                "Failed to enqueue message",
+                                sender=msg.sender,
+                                error=str(result),
+                                error_type=type(result).__name__
+                            )
+
+                # receive_messages already long-polls for up to
+                # poll_interval, so loop straight back into the next receive
+                # instead of adding a fixed delay on top
 
             except Exception as e:
                 self.logger.error(
@@ -136,11 +142,67 @@ class AgenticTodoApp:
                     error_type=type(e).__name__
                 )
 
-                # Wait before retrying
-                await asyncio.sleep(5.0)
+                # Jittered exponential backoff on failure only; waiting on
+                # the shutdown event keeps stop requests immediate
+                await self._interruptible_sleep(backoff + random.uniform(0, 0.5))
+                backoff = min(30.0, backoff * 2)
 
         self.logger.info("Signal message polling stopped")
 
+    async def _enqueue_one(self, msg: SignalMessage) -> None:
+        """
+        Enqueue a single Signal message for processing.
+
+        Args:
+            msg: Received Signal message
+        """
+        async with self._enqueue_semaphore:
+            try:
+                # Wait briefly for free capacity under bursts instead of
+                # failing the moment the queue is full
+                await self.queue_manager.enqueue(
+                    sender=msg.sender,
+                    text=msg.text,
+                    timestamp=msg.timestamp,
+                    metadata=MessageMetadata(
+                        group_id=msg.group_id,
+                        attachments=msg.attachments
+                    ),
+                    wait=0.5
+                )
+
+                if self._info_enabled:
+                    self.logger.info(
+                        "Message enqueued",
+                        sender=msg.sender,
+                        text_preview=msg.text[:50]
+                    )
+
+            except (asyncio.QueueFull, asyncio.TimeoutError):
+                self.logger.error(
+                    "Queue full, cannot process message",
+                    sender=msg.sender
+                )
+
+                # Notify the user without blocking the polling loop on the
+                # Signal round trip
+                asyncio.create_task(self.signal_client.send_error_notification(
+                    msg.sender,
+                    "⚠️ System is currently busy. Please try again in a few moments."
+                ))
+
+    async def _interruptible_sleep(self, delay: float) -> None:
+        """
+        Sleep for up to delay seconds, returning early on shutdown.
+
+        Args:
+            delay: Maximum time to sleep in seconds
+        """
+        try:
+            await asyncio.wait_for(self.shutdown_event.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+
     async def run(self) -> None:
         """Run the main application loop."""
         self.logger.info("Starting Agentic Todo application")
@@ -149,6 +211,10 @@ class AgenticTodoApp:
             # Start queue manager
             await self.queue_manager.start(self.message_handler.handle)
 
+            # Warm the Linear workflow-state cache in the background so the
+            # first task completion doesn't pay the lookup round trip
+            asyncio.create_task(self.linear_client.prime_workflow_cache())
+
             # Start Signal message polling
             polling_task = asyncio.create_task(self.process_signal_messages())
 
@@ -165,6 +231,9 @@ class AgenticTodoApp:
             # Stop queue manager
             await self.queue_manager.stop(wait=True)
 
+            # Release the shared HTTP pool
+            await self.aclose()
+
             # Log final statistics
             stats = self.queue_manager.get_stats()
             self.logger.info("Application stopped", stats=stats)
@@ -177,6 +246,14 @@ class AgenticTodoApp:
             )
             raise
 
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and stop the signal-cli daemon."""
+        # Tail responses flush while the signal client is still alive
+        await self.message_handler.aclose()
+        await self.signal_client.aclose()
+        if not self._http.is_closed:
+            await self._http.aclose()
+
     def handle_shutdown_signal(self, sig: int) -> None:
         """
         Handle shutdown signals gracefully.
@@ -244,6 +321,14 @@ def cli() -> None:
     else:
         config_path = str(config_path)
 
+    # Use the libuv-backed event loop when available; the workload is pure
+    # async I/O, so faster task scheduling benefits every await
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     # Run application
     try:
         asyncio.run(main(config_path))
@@ -1,13 +1,15 @@
 """Signal-CLI client for sending and receiving messages."""
 
 import asyncio
-import json
-import subprocess
-from dataclasses import dataclass
+import itertools
+import logging
+from collections import OrderedDict
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from .config import SignalConfig
+import orjson
+
+from .config import RetryConfig, SignalConfig
 from .error_handler import ErrorSeverity, SignalError
 from .utils.logger import get_logger
 from .utils.retry import retry_decorator
@@ -15,119 +17,261 @@ from .utils.retry import retry_decorator
 logger = get_logger(__name__)
 
 
-@dataclass
 class SignalMessage:
-    """Represents a Signal message."""
+    """
+    Represents a Signal message.
+
+    A plain __slots__ class rather than a dataclass: one instance is
+    allocated per received message, slots drop the per-instance dict,
+    and the attachments default lives in __init__ instead of a separate
+    __post_init__ hook firing per message. (dataclass slots=True needs
+    Python 3.10; the project targets 3.9.)
+    """
 
-    sender: str
-    recipient: str
-    text: str
-    timestamp: datetime
-    group_id: Optional[str] = None
-    attachments: List[str] = None
+    __slots__ = ("sender", "recipient", "text", "timestamp", "group_id", "attachments")
 
-    def __post_init__(self):
-        if self.attachments is None:
-            self.attachments = []
+    def __init__(
+        self,
+        sender: str,
+        recipient: str,
+        text: str,
+        timestamp: datetime,
+        group_id: Optional[str] = None,
+        attachments: Optional[List[str]] = None
+    ):
+        self.sender = sender
+        self.recipient = recipient
+        self.text = text
+        self.timestamp = timestamp
+        self.group_id = group_id
+        self.attachments = attachments if attachments is not None else []
 
 
 class SignalClient:
-    """Client for interacting with Signal via signal-cli."""
-
-    def __init__(self, config: SignalConfig, retry_config: dict):
+    """
+    Client for interacting with Signal via a persistent signal-cli daemon.
+
+    signal-cli is a JVM program with a 500 ms-2 s cold start, so spawning
+    a fresh subprocess per send/receive dominated every operation. One
+    ``signal-cli jsonRpc`` daemon is started lazily and reused for all
+    commands over its stdin/stdout pipe: requests are correlated to
+    responses by JSON-RPC id, and incoming messages arrive as ``receive``
+    notifications that a background reader task queues for
+    receive_messages to drain.
+    """
+
+    def __init__(self, config: SignalConfig, retry_config: RetryConfig):
         """
         Initialize Signal client.
 
+        The daemon itself is started on first use, not here, since
+        __init__ runs outside the event loop.
+
         Args:
             config: Signal configuration
-            retry_config: Retry configuration dict
+            retry_config: Retry configuration
         """
         self.config = config
         self.retry_config = retry_config
         self.logger = get_logger(__name__)
 
-    async def _run_signal_command(
-        self,
-        args: List[str],
-        timeout: float = 30.0,
-        json_output: bool = False
-    ) -> str:
-        """
-        Run a signal-cli command.
+        # Resolved once: per-send and per-batch logs skip kwarg packaging
+        # and the processor chain entirely when INFO is filtered out. The
+        # stdlib logger is consulted because structlog's default wrapper
+        # (used before setup_logging configures it) has no isEnabledFor.
+        self._info_enabled = logging.getLogger(__name__).isEnabledFor(logging.INFO)
 
-        Args:
-            args: Command arguments
-            timeout: Command timeout in seconds
-            json_output: Use JSON output format
+        # Built once; restarts after a daemon crash skip the config
+        # attribute traversal and list assembly
+        self._daemon_cmd = (config.cli_path, "-a", config.account, "jsonRpc")
 
-        Returns:
-            Command output
+        self._daemon_proc: Optional[asyncio.subprocess.Process] = None
+        self._daemon_lock = asyncio.Lock()
+        self._reader_task: Optional[asyncio.Task] = None
 
-        Raises:
-            SignalError: If command fails
+        # In-flight JSON-RPC calls awaiting their response, keyed by id
+        self._rpc_id = itertools.count(1)
+        self._pending: Dict[int, asyncio.Future] = {}
+
+        # Incoming message notifications pushed by the reader task
+        self._incoming: asyncio.Queue = asyncio.Queue()
+
+        # Outbound sends buffered for a short window so a burst collapses
+        # into fewer daemon round trips; direct sends sharing the same
+        # text merge into one JSON-RPC call with multiple recipients
+        self._send_buffer: List[Tuple[str, Optional[str], str, asyncio.Future]] = []
+        self._send_flush_task: Optional[asyncio.Task] = None
+        self._send_batch_window = 0.02
+        self._send_max_batch = 32
+
+    async def _ensure_daemon(self) -> asyncio.subprocess.Process:
         """
-        # Build command with JSON output flag if requested
-        cmd = [self.config.cli_path]
-        if json_output:
-            cmd.extend(["--output", "json"])
-        cmd.extend(["-a", self.config.account])
-        cmd.extend(args)
+        Start the signal-cli daemon if it is not already running.
 
-        try:
-            self.logger.debug("Running signal-cli command", command=cmd)
+        Returns:
+            The running daemon process
 
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
+        Raises:
+            SignalError: If signal-cli cannot be started
+        """
+        async with self._daemon_lock:
+            if (
+                self._daemon_proc is not None
+                and self._daemon_proc.returncode is None
+            ):
+                return self._daemon_proc
 
             try:
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(),
-                    timeout=timeout
+                self._daemon_proc = await asyncio.create_subprocess_exec(
+                    *self._daemon_cmd,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    # The daemon logs progress chatter to stderr; piping it
+                    # unread would eventually fill the pipe and stall the JVM
+                    stderr=asyncio.subprocess.DEVNULL
                 )
-            except asyncio.TimeoutError:
-                process.kill()
+            except FileNotFoundError:
                 raise SignalError(
-                    f"Signal command timed out after {timeout}s",
-                    severity=ErrorSeverity.MEDIUM,
-                    context={"command": args}
+                    f"signal-cli not found at {self.config.cli_path}",
+                    severity=ErrorSeverity.HIGH,
+                    user_message="Signal is not properly installed. Please install signal-cli.",
+                    context={"cli_path": self.config.cli_path}
                 )
-
-            if process.returncode != 0:
-                error_msg = stderr.decode('utf-8').strip()
+            except Exception as e:
                 raise SignalError(
-                    f"Signal command failed: {error_msg}",
-                    severity=ErrorSeverity.MEDIUM,
-                    context={
-                        "command": args,
-                        "return_code": process.returncode,
-                        "stderr": error_msg
-                    }
+                    f"Failed to start signal-cli daemon: {str(e)}",
+                    severity=ErrorSeverity.HIGH,
+                    original_error=e,
+                    context={"cli_path": self.config.cli_path}
                 )
 
-            output = stdout.decode('utf-8').strip()
-            self.logger.debug("Signal command completed", output_length=len(output))
-            return output
+            self.logger.info(
+                "Started signal-cli daemon",
+                pid=self._daemon_proc.pid
+            )
+
+            loop = asyncio.get_running_loop()
+            self._reader_task = loop.create_task(
+                self._read_daemon_output(self._daemon_proc)
+            )
+
+            return self._daemon_proc
+
+    async def _read_daemon_output(self, proc: asyncio.subprocess.Process) -> None:
+        """
+        Route the daemon's stdout: responses to callers, messages to the queue.
+
+        Runs as a background task for the daemon's lifetime. Each stdout
+        line is either a JSON-RPC response (matched to a pending future by
+        id) or a ``receive`` notification (queued for receive_messages).
+
+        Args:
+            proc: Daemon process whose stdout to read
+        """
+        while True:
+            line = await proc.stdout.readline()
+            if not line:
+                break
+
+            try:
+                data = orjson.loads(line)
+            except orjson.JSONDecodeError as e:
+                self.logger.warning(
+                    "Failed to parse daemon output",
+                    line=line.decode('utf-8', 'replace'),
+                    error=str(e)
+                )
+                continue
+
+            msg_id = data.get("id")
+            if msg_id is not None:
+                future = self._pending.pop(msg_id, None)
+                if future is not None and not future.done():
+                    future.set_result(data)
+            elif data.get("method") == "receive":
+                self._incoming.put_nowait(data.get("params", {}))
+
+        # Daemon exited: fail whatever is still waiting so callers don't
+        # hang; the next call restarts the daemon via _ensure_daemon
+        await proc.wait()
+        self.logger.error(
+            "signal-cli daemon exited",
+            return_code=proc.returncode
+        )
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(SignalError(
+                    "signal-cli daemon exited mid-request",
+                    severity=ErrorSeverity.HIGH,
+                    context={"return_code": proc.returncode}
+                ))
+
+    async def _rpc_call(
+        self,
+        method: str,
+        params: Dict[str, Any],
+        timeout: float = 30.0
+    ) -> Any:
+        """
+        Issue a JSON-RPC call to the daemon and wait for its response.
+
+        Args:
+            method: JSON-RPC method name
+            params: Method parameters
+            timeout: Response timeout in seconds
+
+        Returns:
+            The response's result field
+
+        Raises:
+            SignalError: If the call fails or times out
+        """
+        proc = await self._ensure_daemon()
 
-        except FileNotFoundError:
+        rpc_id = next(self._rpc_id)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[rpc_id] = future
+
+        payload = orjson.dumps({
+            "jsonrpc": "2.0",
+            "id": rpc_id,
+            "method": method,
+            "params": params
+        }) + b"\n"
+
+        try:
+            proc.stdin.write(payload)
+            await proc.stdin.drain()
+            response = await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            self._pending.pop(rpc_id, None)
             raise SignalError(
-                f"signal-cli not found at {self.config.cli_path}",
-                severity=ErrorSeverity.HIGH,
-                user_message="Signal is not properly installed. Please install signal-cli.",
-                context={"cli_path": self.config.cli_path}
+                f"Signal command timed out after {timeout}s",
+                severity=ErrorSeverity.MEDIUM,
+                context={"method": method}
             )
+        except SignalError:
+            raise
         except Exception as e:
-            if isinstance(e, SignalError):
-                raise
+            self._pending.pop(rpc_id, None)
             raise SignalError(
                 f"Failed to execute signal-cli command: {str(e)}",
                 severity=ErrorSeverity.MEDIUM,
                 original_error=e,
-                context={"command": args}
+                context={"method": method}
             )
 
+        error = response.get("error")
+        if error:
+            raise SignalError(
+                f"Signal command failed: {error.get('message', error)}",
+                severity=ErrorSeverity.MEDIUM,
+                context={"method": method, "error": error}
+            )
+
+        return response.get("result")
+
     @retry_decorator(max_attempts=3, base_delay=1.0, exponential_backoff=True)
     async def send_message(
         self,
@@ -150,21 +294,27 @@ class SignalClient:
             SignalError: If message sending fails
         """
         try:
-            args = ["send", "-m", message]
-
-            if group_id:
-                args.extend(["-g", group_id])
-            else:
-                args.append(recipient)
+            # Buffer the send; the flush task coalesces whatever arrives
+            # within the batch window into as few daemon calls as possible
+            future = asyncio.get_running_loop().create_future()
+            self._send_buffer.append((recipient, group_id, message, future))
+
+            if len(self._send_buffer) >= self._send_max_batch:
+                await self._flush_sends()
+            elif self._send_flush_task is None or self._send_flush_task.done():
+                self._send_flush_task = asyncio.get_running_loop().create_task(
+                    self._flush_sends_after_window()
+                )
 
-            await self._run_signal_command(args)
+            await future
 
-            self.logger.info(
-                "Message sent successfully",
-                recipient=recipient,
-                group_id=group_id,
-                message_length=len(message)
-            )
+            if self._info_enabled:
+                self.logger.info(
+                    "Message sent successfully",
+                    recipient=recipient,
+                    group_id=group_id,
+                    message_length=len(message)
+                )
             return True
 
         except Exception as e:
@@ -175,12 +325,63 @@ class SignalClient:
             )
             raise
 
+    async def _flush_sends_after_window(self) -> None:
+        """Flush buffered sends once the batch window elapses."""
+        await asyncio.sleep(self._send_batch_window)
+        await self._flush_sends()
+
+    async def _flush_sends(self) -> None:
+        """
+        Issue buffered sends, merging identical direct messages.
+
+        Direct sends that share the same text (e.g. a burst of identical
+        busy notifications) become one JSON-RPC ``send`` with a combined
+        recipient list; group sends are never merged, since two sends to
+        the same group are two distinct messages.
+        """
+        batch, self._send_buffer = self._send_buffer, []
+        if not batch:
+            return
+
+        # key -> (recipients, futures, params); insertion-ordered so
+        # messages leave in the order they were submitted
+        merged: "OrderedDict[Any, Tuple[list, list, Dict[str, Any]]]" = OrderedDict()
+        for recipient, group_id, message, future in batch:
+            if group_id:
+                # Unique object as key: group sends never merge
+                merged[object()] = ([], [future], {"message": message, "groupId": group_id})
+            else:
+                key = (message, None)
+                if key not in merged:
+                    merged[key] = ([], [], {"message": message})
+                recipients, futures, _ = merged[key]
+                recipients.append(recipient)
+                futures.append(future)
+
+        for recipients, futures, params in merged.values():
+            if recipients:
+                params["recipient"] = recipients
+            try:
+                result = await self._rpc_call("send", params)
+            except Exception as e:
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for future in futures:
+                    if not future.done():
+                        future.set_result(result)
+
     async def receive_messages(self, timeout: float = 1.0) -> List[SignalMessage]:
         """
         Receive new messages from Signal.
 
+        The daemon pushes incoming messages as notifications, so this
+        drains the notification queue for up to ``timeout`` seconds
+        rather than spawning a receive subprocess.
+
         Args:
-            timeout: Receive timeout in seconds
+            timeout: How long to collect incoming messages in seconds
 
         Returns:
             List of received messages
@@ -189,54 +390,47 @@ class SignalClient:
             SignalError: If receiving fails
         """
         try:
-            # Pass timeout to signal-cli and add buffer for subprocess timeout
-            output = await self._run_signal_command(
-                ["receive", "-t", str(int(timeout))],
-                timeout=timeout + 5.0,  # Add 5 second buffer for subprocess
-                json_output=True
-            )
-
-            if not output:
-                return []
+            await self._ensure_daemon()
 
             messages = []
-            for line in output.split('\n'):
-                if not line.strip():
-                    continue
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout
+
+            while True:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
 
                 try:
-                    data = json.loads(line)
-                    envelope = data.get('envelope', {})
-
-                    # Check if it's a data message
-                    data_message = envelope.get('dataMessage')
-                    if not data_message:
-                        continue
-
-                    message_text = data_message.get('message', '')
-                    if not message_text:
-                        continue
-
-                    message = SignalMessage(
-                        sender=envelope.get('source', ''),
-                        recipient=self.config.account,
-                        text=message_text,
-                        timestamp=datetime.fromtimestamp(
-                            envelope.get('timestamp', 0) / 1000
-                        ),
-                        group_id=data_message.get('groupInfo', {}).get('groupId')
+                    params = await asyncio.wait_for(
+                        self._incoming.get(),
+                        timeout=remaining
                     )
-                    messages.append(message)
+                except asyncio.TimeoutError:
+                    break
 
-                except json.JSONDecodeError as e:
-                    self.logger.warning(
-                        "Failed to parse message JSON",
-                        line=line,
-                        error=str(e)
-                    )
+                envelope = params.get('envelope', {})
+
+                # Check if it's a data message
+                data_message = envelope.get('dataMessage')
+                if not data_message:
+                    continue
+
+                message_text = data_message.get('message', '')
+                if not message_text:
                     continue
 
-            if messages:
+                messages.append(SignalMessage(
+                    sender=envelope.get('source', ''),
+                    recipient=self.config.account,
+                    text=message_text,
+                    timestamp=datetime.fromtimestamp(
+                        envelope.get('timestamp', 0) / 1000
+                    ),
+                    group_id=data_message.get('groupInfo', {}).get('groupId')
+                ))
+
+            if messages and self._info_enabled:
                 self.logger.info(f"Received {len(messages)} new messages")
 
             return messages
@@ -270,3 +464,22 @@ class SignalClient:
                 recipient=recipient,
                 error=str(e)
             )
+
+    async def aclose(self) -> None:
+        """Stop the signal-cli daemon and its reader task."""
+        if self._send_flush_task is not None and not self._send_flush_task.done():
+            self._send_flush_task.cancel()
+            await asyncio.gather(self._send_flush_task, return_exceptions=True)
+
+        # Drain anything still buffered before the daemon goes away
+        await self._flush_sends()
+
+        if self._daemon_proc is not None and self._daemon_proc.returncode is None:
+            self._daemon_proc.terminate()
+            await self._daemon_proc.wait()
+
+        if self._reader_task is not None:
+            await asyncio.gather(self._reader_task, return_exceptions=True)
+            self._reader_task = None
+
+        self._daemon_proc = None
@@ -0,0 +1,36 @@
+"""Shared httpx client construction for the API clients."""
+
+from typing import Optional, Union
+
+import httpx
+
+# Sized for a single process-wide pool serving every API host; HTTP/2
+# multiplexes per host, so the hard cap is rarely approached
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=128,
+    max_keepalive_connections=64,
+    keepalive_expiry=60.0
+)
+
+
+def create_async_client(
+    limits: Optional[httpx.Limits] = None,
+    timeout: Union[httpx.Timeout, float] = 60.0
+) -> httpx.AsyncClient:
+    """
+    Create an AsyncClient with HTTP/2 enabled when h2 is installed.
+
+    Args:
+        limits: Connection pool limits (defaults to the shared pool sizing)
+        timeout: Default timeout applied to requests
+
+    Returns:
+        Configured AsyncClient
+    """
+    kwargs = {"limits": limits or DEFAULT_LIMITS, "timeout": timeout}
+
+    try:
+        return httpx.AsyncClient(http2=True, **kwargs)
+    except ImportError:
+        # h2 not installed; fall back to HTTP/1.1 with the same pool
+        return httpx.AsyncClient(**kwargs)
@@ -5,6 +5,7 @@ import sys
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+import orjson
 import structlog
 from pythonjsonlogger import jsonlogger
 
@@ -12,6 +13,10 @@ from pythonjsonlogger import jsonlogger
 class CustomJsonFormatter(jsonlogger.JsonFormatter):
     """Custom JSON formatter with additional context."""
 
+    def jsonify_log_record(self, log_record: Dict[str, Any]) -> str:
+        """Serialize the record with orjson instead of stdlib json."""
+        return orjson.dumps(log_record, default=str).decode()
+
     def add_fields(
         self,
         log_record: Dict[str, Any],
@@ -2,6 +2,8 @@
 
 import asyncio
 import functools
+import random
+import re
 from typing import Any, Callable, Optional, Tuple, Type, TypeVar, Union
 
 from ..utils.logger import get_logger
@@ -10,6 +12,33 @@ logger = get_logger(__name__)
 
 T = TypeVar('T')
 
+# Exception types that are always worth retrying
+_TRANSIENT_TYPES = (
+    ConnectionError,
+    TimeoutError,
+    asyncio.TimeoutError,
+)
+
+# Message fragments that mark an error as transient; compiled into one
+# alternation so classification is a single C-level scan instead of one
+# Python substring pass per keyword (IGNORECASE also drops the .lower()
+# copy of the message)
+_TRANSIENT_RE = re.compile(
+    "|".join(map(re.escape, (
+        'timeout',
+        'connection',
+        'temporary',
+        'unavailable',
+        'rate limit',
+        'too many requests',
+        '429',
+        '502',
+        '503',
+        '504',
+    ))),
+    re.IGNORECASE
+)
+
 
 class RetryError(Exception):
     """Raised when all retry attempts have been exhausted."""
@@ -30,32 +59,59 @@ def is_transient_error(error: Exception) -> bool:
     Returns:
         True if the error is transient, False otherwise
     """
-    # Network-related errors
-    transient_types = (
-        ConnectionError,
-        TimeoutError,
-        asyncio.TimeoutError,
+    # The same exception object is re-classified on every retry attempt;
+    # remember the verdict on the instance so only the first check pays
+    # for the scan
+    cached = getattr(error, '_is_transient', None)
+    if cached is not None:
+        return cached
+
+    if isinstance(error, _TRANSIENT_TYPES):
+        # Network-related errors
+        result = True
+    else:
+        # Check error message for transient indicators
+        result = _TRANSIENT_RE.search(str(error)) is not None
+
+    try:
+        error._is_transient = result
+    except AttributeError:
+        # Exceptions without a __dict__ just skip the memoization
+        pass
+
+    return result
+
+
+def _should_retry(
+    error: Exception,
+    retry_exceptions: Optional[Tuple[Type[Exception], ...]]
+) -> bool:
+    """Decide whether an exception is worth another attempt."""
+    return (
+        retry_exceptions is None or
+        isinstance(error, retry_exceptions) or
+        is_transient_error(error)
     )
 
-    if isinstance(error, transient_types):
-        return True
 
-    # Check error message for transient indicators
-    error_msg = str(error).lower()
-    transient_keywords = [
-        'timeout',
-        'connection',
-        'temporary',
-        'unavailable',
-        'rate limit',
-        'too many requests',
-        '429',
-        '502',
-        '503',
-        '504',
-    ]
+def _compute_delay(
+    attempt: int,
+    base_delay: float,
+    max_delay: float,
+    exponential_backoff: bool
+) -> float:
+    """
+    Compute the jittered delay before the next attempt.
 
-    return any(keyword in error_msg for keyword in transient_keywords)
+    Jitter desynchronizes concurrent retriers that failed together, so
+    they don't hammer the upstream in lockstep on every subsequent
+    attempt.
+    """
+    if exponential_backoff:
+        delay = base_delay * (2 ** (attempt - 1))
+    else:
+        delay = base_delay
+    return min(delay * random.uniform(0.5, 1.5), max_delay)
 
 
 async def retry_async(
@@ -112,13 +168,7 @@ async def retry_async(
             last_error = e
 
             # Check if we should retry this exception
-            should_retry = (
-                retry_exceptions is None or
-                isinstance(e, retry_exceptions) or
-                is_transient_error(e)
-            )
-
-            if not should_retry or attempt == max_attempts:
+            if not _should_retry(e, retry_exceptions) or attempt == max_attempts:
                 logger.error(
                     "Function failed permanently",
                     function=func.__name__,
@@ -132,11 +182,9 @@ async def retry_async(
                     attempts=attempt
                 )
 
-            # Calculate delay
-            if exponential_backoff:
-                delay = min(base_delay * (2 ** (attempt - 1)), max_delay)
-            else:
-                delay = base_delay
+            delay = _compute_delay(
+                attempt, base_delay, max_delay, exponential_backoff
+            )
 
             logger.warning(
                 "Function failed, retrying",
@@ -183,15 +231,66 @@ def retry_decorator(
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @functools.wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> T:
-            return await retry_async(
-                func,
-                *args,
-                max_attempts=max_attempts,
-                base_delay=base_delay,
-                max_delay=max_delay,
-                exponential_backoff=exponential_backoff,
-                retry_exceptions=retry_exceptions,
-                **kwargs
-            )
+            # Fast path: a call that succeeds first try costs one frame
+            # and no retry bookkeeping; the loop below only runs after a
+            # failure
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                if not _should_retry(e, retry_exceptions) or max_attempts <= 1:
+                    logger.error(
+                        "Function failed permanently",
+                        function=func.__name__,
+                        attempt=1,
+                        error=str(e),
+                        error_type=type(e).__name__
+                    )
+                    raise RetryError(
+                        f"Failed after 1 attempts: {str(e)}",
+                        original_error=e,
+                        attempts=1
+                    )
+                last_error = e
+
+            attempt = 1
+            while True:
+                delay = _compute_delay(
+                    attempt, base_delay, max_delay, exponential_backoff
+                )
+                logger.warning(
+                    "Function failed, retrying",
+                    function=func.__name__,
+                    attempt=attempt,
+                    max_attempts=max_attempts,
+                    error=str(last_error),
+                    error_type=type(last_error).__name__,
+                    retry_delay=delay
+                )
+                await asyncio.sleep(delay)
+
+                attempt += 1
+                try:
+                    result = await func(*args, **kwargs)
+                    logger.info(
+                        "Function succeeded after retry",
+                        function=func.__name__,
+                        attempt=attempt
+                    )
+                    return result
+                except Exception as e:
+                    last_error = e
+                    if not _should_retry(e, retry_exceptions) or attempt == max_attempts:
+                        logger.error(
+                            "Function failed permanently",
+                            function=func.__name__,
+                            attempt=attempt,
+                            error=str(e),
+                            error_type=type(e).__name__
+                        )
+                        raise RetryError(
+                            f"Failed after {attempt} attempts: {str(e)}",
+                            original_error=e,
+                            attempts=attempt
+                        )
         return wrapper
     return decorator
@@ -1,5 +1,7 @@
 """Pytest configuration and shared fixtures."""
 
+import asyncio
+import importlib.util
 import os
 import sys
 from pathlib import Path
@@ -10,6 +12,18 @@ import pytest
 src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
 
+def pytest_asyncio_loop_factories(config, item):
+    """
+    Run the async tests under uvloop as well when it's installed,
+    since that's the loop production uses on Linux; without uvloop only
+    the stdlib loop runs (no skipped placeholders).
+    """
+    factories = {"asyncio": asyncio.new_event_loop}
+    if importlib.util.find_spec("uvloop") is not None:
+        import uvloop
+        factories["uvloop"] = uvloop.new_event_loop
+    return factories
+
 
 @pytest.fixture(autouse=True)
 def env_setup(monkeypatch):
@@ -2,8 +2,8 @@
 
 import asyncio
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock
 
+import orjson
 import pytest
 
 from src.queue_manager import MessageStatus, QueueManager, QueuedMessage
@@ -45,6 +45,44 @@ class TestQueuedMessage:
         assert data["status"] == "pending"
         assert isinstance(data["timestamp"], str)
 
+    def test_message_to_json(self):
+        """Test single-pass JSON serialization."""
+        message = QueuedMessage(
+            id="test-123",
+            sender="+1234567890",
+            text="Hello world",
+            timestamp=datetime.now()
+        )
+
+        data = orjson.loads(message.to_json_bytes())
+
+        assert data["id"] == "test-123"
+        assert data["status"] == "pending"
+        assert isinstance(data["timestamp"], str)
+
+    def test_status_is_int(self):
+        """Test statuses compare as plain ints but serialize as names."""
+        assert int(MessageStatus.PENDING) == 0
+
+        message = QueuedMessage(
+            id="test-123",
+            sender="+1234567890",
+            text="Hello world",
+            timestamp=datetime.now()
+        )
+        assert message.to_dict()["status"] == "pending"
+
+    def test_message_no_dict(self):
+        """Test slotted messages carry no per-instance __dict__."""
+        message = QueuedMessage(
+            id="test-123",
+            sender="+1234567890",
+            text="Hello world",
+            timestamp=datetime.now()
+        )
+
+        assert not hasattr(message, "__dict__")
+
 
 class TestQueueManager:
     """Test QueueManager functionality."""
@@ -89,6 +127,20 @@ class TestQueueManager:
         message = queue_manager.get_message(message_id)
         assert message.metadata == metadata
 
+    @pytest.mark.asyncio
+    async def test_metadata_sharing(self, queue_manager):
+        """Test identical metadata payloads share one mapping."""
+        msg1_id = await queue_manager.enqueue(
+            "+1111111111", "Message 1", metadata={"group_id": "abc123"}
+        )
+        msg2_id = await queue_manager.enqueue(
+            "+2222222222", "Message 2", metadata={"group_id": "abc123"}
+        )
+
+        msg1 = queue_manager.get_message(msg1_id)
+        msg2 = queue_manager.get_message(msg2_id)
+        assert msg1.metadata is msg2.metadata
+
     @pytest.mark.asyncio
     async def test_queue_full(self):
         """Test behavior when queue is full."""
@@ -102,6 +154,16 @@ class TestQueueManager:
         with pytest.raises(asyncio.QueueFull):
             await queue_manager.enqueue("+3333333333", "Message 3")
 
+    @pytest.mark.asyncio
+    async def test_try_enqueue_full(self):
+        """Test try_enqueue returns None instead of raising when full."""
+        queue_manager = QueueManager(max_size=2)
+
+        assert queue_manager.try_enqueue("+1111111111", "Message 1") is not None
+        assert queue_manager.try_enqueue("+2222222222", "Message 2") is not None
+
+        assert queue_manager.try_enqueue("+3333333333", "Message 3") is None
+
     @pytest.mark.asyncio
     async def test_process_message_success(self, queue_manager):
         """Test successful message processing."""
@@ -124,6 +186,24 @@ class TestQueueManager:
         assert message.completed_at is not None
         assert message.error is None
 
+    @pytest.mark.asyncio
+    async def test_process_sync_handler(self, queue_manager):
+        """Test plain sync handlers run on the executor."""
+        def sync_handler(message):
+            return f"Processed: {message.text}"
+
+        message = QueuedMessage(
+            id="test-123",
+            sender="+1234567890",
+            text="Test message",
+            timestamp=datetime.now()
+        )
+
+        await queue_manager.process_message(message, sync_handler)
+
+        assert message.status == MessageStatus.COMPLETED
+        assert message.result == "Processed: Test message"
+
     @pytest.mark.asyncio
     async def test_process_message_timeout(self, queue_manager):
         """Test message processing timeout."""
@@ -183,8 +263,8 @@ class TestQueueManager:
         msg1_id = await queue_manager.enqueue("+1111111111", "Message 1")
         msg2_id = await queue_manager.enqueue("+2222222222", "Message 2")
 
-        # Give workers time to process
-        await asyncio.sleep(0.5)
+        # Wait for the queue to drain instead of sleeping a fixed time
+        await asyncio.wait_for(queue_manager.queue.join(), timeout=2.0)
 
         # Stop workers
         await queue_manager.stop(wait=True)
@@ -240,12 +320,12 @@ class TestQueueManager:
     async def test_concurrent_processing(self, queue_manager):
         """Test concurrent message processing."""
         processing_times = []
+        loop = asyncio.get_running_loop()
 
         async def test_handler(message):
-            start = asyncio.get_event_loop().time()
+            start = loop.time()
             await asyncio.sleep(0.1)  # Simulate work
-            end = asyncio.get_event_loop().time()
-            processing_times.append(end - start)
+            processing_times.append(loop.time() - start)
             return "Done"
 
         await queue_manager.start(test_handler)
@@ -263,6 +343,81 @@ class TestQueueManager:
 
         await queue_manager.stop()
 
+    @pytest.mark.asyncio
+    async def test_batch_drain(self):
+        """Test a worker drains queued messages in batches."""
+        queue_manager = QueueManager(max_workers=1, max_size=10, batch_size=4)
+        processed = []
+
+        async def test_handler(message):
+            processed.append(message.id)
+            return "Done"
+
+        # Queue up a burst before the worker starts so the first wakeup
+        # finds a full batch to drain
+        message_ids = []
+        for i in range(4):
+            message_ids.append(
+                await queue_manager.enqueue(f"+{i}", f"Message {i}")
+            )
+
+        await queue_manager.start(test_handler)
+        await queue_manager.queue.join()
+        await queue_manager.stop()
+
+        assert processed == message_ids
+
+    @pytest.mark.asyncio
+    async def test_message_pool_recycling(self):
+        """Test evicted messages return to the freelist and get reused."""
+        queue_manager = QueueManager(max_size=10, max_tracked=2)
+
+        async def test_handler(message):
+            return "Done"
+
+        await queue_manager.start(test_handler)
+
+        for i in range(5):
+            await queue_manager.enqueue(f"+{i}", f"Message {i}")
+
+        await queue_manager.queue.join()
+        await queue_manager.stop()
+
+        # Retention keeps max_tracked messages; the evicted ones are pooled
+        assert len(queue_manager.messages) == 2
+        assert len(queue_manager._pool) == 3
+
+        # The next enqueue reuses a pooled instance instead of allocating
+        pooled = queue_manager._pool[-1]
+        message_id = await queue_manager.enqueue("+9", "Reused")
+        assert queue_manager.get_message(message_id) is pooled
+
+    @pytest.mark.asyncio
+    async def test_tracked_message_eviction(self):
+        """Test tracked messages stay bounded as processing continues."""
+        queue_manager = QueueManager(max_size=20, max_tracked=3)
+
+        async def test_handler(message):
+            return "Done"
+
+        await queue_manager.start(test_handler)
+
+        message_ids = []
+        for i in range(9):
+            message_ids.append(
+                await queue_manager.enqueue(f"+{i}", f"Message {i}")
+            )
+
+        await queue_manager.queue.join()
+        await queue_manager.stop()
+
+        # Retention holds the bound instead of growing per message
+        assert len(queue_manager.messages) == 3
+
+        # Oldest finishers were evicted; the most recent one survives
+        assert queue_manager.get_message(message_ids[0]) is None
+        assert queue_manager.get_message(message_ids[-1]) is not None
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])